@@ -8,9 +8,45 @@ import sys
 import os
 import subprocess
 import shutil
+import argparse
 from pathlib import Path
 
 
+# PyInstaller spec and NSIS installer templates
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+
+# Modules the GUI never imports; excluding them keeps the bundle small and
+# speeds up bootloader start. NumPy and PyArrow are optional in the converter,
+# which falls back to pure Python without them.
+EXCLUDED_MODULES = [
+    'numpy',
+    'pyarrow',
+    'scipy',
+    'matplotlib',
+    'pandas',
+    'PIL',
+    'test',
+    'unittest',
+    'pydoc',
+    'lib2to3',
+]
+
+
+def install_packages(packages):
+    """Install packages with pip, in-process when possible"""
+    try:
+        # Running pip in-process avoids starting a second interpreter.
+        # pip's internals are not a supported API, so fall back if they move.
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + packages)
+        return
+    
+    exit_code = pip_main(['install', '--disable-pip-version-check'] + packages)
+    if exit_code:
+        raise RuntimeError(f"pip install failed with exit code {exit_code}")
+
+
 def check_requirements():
     """Check if required packages are installed"""
     required = ['PyInstaller', 'openpyxl']
@@ -25,61 +61,26 @@ def check_requirements():
     if missing:
         print(f"❌ Missing packages: {', '.join(missing)}")
         print("\nInstalling missing packages...")
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + missing)
+        install_packages(missing)
         print("✅ Packages installed successfully")
     else:
         print("✅ All required packages are installed")
 
 
-def create_spec_file():
-    """Create PyInstaller spec file for better control"""
-    spec_content = """# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
+def render_template(name, **values):
+    """Load a build template and fill in its @NAME@ placeholders"""
+    text = (TEMPLATE_DIR / name).read_text(encoding='utf-8')
+    for key, value in values.items():
+        text = text.replace(f'@{key}@', value)
+    return text
 
-a = Analysis(
-    ['glucose_converter_gui.py'],
-    pathex=[],
-    binaries=[],
-    datas=[
-        ('glucose_converter.py', '.'),
-    ],
-    hiddenimports=['openpyxl', 'tkinter'],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
 
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='GlucoseConverter',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # Set to False for GUI app (no console window)
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='icon.ico' if os.path.exists('icon.ico') else None,
-)
-"""
+def create_spec_file():
+    """Create PyInstaller spec file for better control"""
+    spec_content = render_template(
+        'glucose_converter.spec.tmpl',
+        EXCLUDES=repr(EXCLUDED_MODULES)
+    )
     
     with open('glucose_converter.spec', 'w') as f:
         f.write(spec_content)
@@ -87,20 +88,34 @@ exe = EXE(
     print("✅ Created PyInstaller spec file")
 
 
-def build_executable():
-    """Build the executable using PyInstaller"""
+def build_executable(portable=False, compress=False):
+    """Build the executable using PyInstaller
+    
+    By default a one-folder build is created, which starts much faster than
+    a one-file build because nothing is unpacked to a temp folder on launch.
+    Pass ``portable=True`` for a single self-extracting executable and
+    ``compress=True`` to UPX-pack binaries (smaller, but slower to start).
+    """
     print("\n🔨 Building executable...")
     
     # Build command
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--onefile',  # Single file executable
+        '--onefile' if portable else '--onedir',
         '--windowed',  # No console window for GUI app
         '--name', 'GlucoseConverter',
         '--clean',  # Clean build
         '--noconfirm',  # Overwrite without asking
     ]
     
+    # Skip UPX unless a smaller download matters more than startup time
+    if not compress:
+        cmd.append('--noupx')
+    
+    # Leave out modules the converter does not use
+    for module in EXCLUDED_MODULES:
+        cmd.extend(['--exclude-module', module])
+    
     # Add icon if exists
     if os.path.exists('icon.ico'):
         cmd.extend(['--icon', 'icon.ico'])
@@ -108,13 +123,20 @@ def build_executable():
     # Add the GUI script
     cmd.append('glucose_converter_gui.py')
     
+    # PyInstaller compiles bundled modules at the running interpreter's
+    # optimization level; -OO drops asserts and docstrings
+    env = dict(os.environ, PYTHONOPTIMIZE='2')
+    
     # Run PyInstaller
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env=env)
         print("✅ Build completed successfully!")
         
         # Check if exe was created
-        exe_path = Path('dist') / 'GlucoseConverter.exe'
+        if portable:
+            exe_path = Path('dist') / 'GlucoseConverter.exe'
+        else:
+            exe_path = Path('dist') / 'GlucoseConverter' / 'GlucoseConverter.exe'
         if exe_path.exists():
             print(f"\n📦 Executable created: {exe_path}")
             print(f"   Size: {exe_path.stat().st_size / (1024*1024):.2f} MB")
@@ -128,87 +150,14 @@ def build_executable():
         return None
 
 
-def create_installer_script():
+def create_installer_script(portable=False):
     """Create NSIS installer script for professional installation"""
-    nsis_script = """!define APPNAME "Glucose Converter"
-!define COMPANYNAME "Your Company"
-!define DESCRIPTION "Convert Contour Plus glucose CSV to formatted XLSX"
-!define VERSIONMAJOR 1
-!define VERSIONMINOR 0
-!define VERSIONBUILD 0
-!define HELPURL "http://yourwebsite.com"
-!define UPDATEURL "http://yourwebsite.com"
-!define ABOUTURL "http://yourwebsite.com"
-
-RequestExecutionLevel admin
-
-InstallDir "$PROGRAMFILES\\${APPNAME}"
-
-Name "${APPNAME}"
-OutFile "GlucoseConverter_Setup.exe"
-
-!include "MUI2.nsh"
-
-!insertmacro MUI_PAGE_WELCOME
-!insertmacro MUI_PAGE_DIRECTORY
-!insertmacro MUI_PAGE_INSTFILES
-!insertmacro MUI_PAGE_FINISH
-
-!insertmacro MUI_UNPAGE_WELCOME
-!insertmacro MUI_UNPAGE_CONFIRM
-!insertmacro MUI_UNPAGE_INSTFILES
-!insertmacro MUI_UNPAGE_FINISH
-
-!insertmacro MUI_LANGUAGE "English"
-
-Section "install"
-    SetOutPath $INSTDIR
-    
-    File "dist\\GlucoseConverter.exe"
-    
-    # Create uninstaller
-    WriteUninstaller "$INSTDIR\\uninstall.exe"
-    
-    # Start Menu
-    CreateDirectory "$SMPROGRAMS\\${APPNAME}"
-    CreateShortcut "$SMPROGRAMS\\${APPNAME}\\${APPNAME}.lnk" "$INSTDIR\\GlucoseConverter.exe"
-    CreateShortcut "$SMPROGRAMS\\${APPNAME}\\Uninstall.lnk" "$INSTDIR\\uninstall.exe"
-    
-    # Desktop shortcut
-    CreateShortcut "$DESKTOP\\${APPNAME}.lnk" "$INSTDIR\\GlucoseConverter.exe"
-    
-    # Registry information for add/remove programs
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "DisplayName" "${APPNAME}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "UninstallString" "$INSTDIR\\uninstall.exe"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "InstallLocation" "$INSTDIR"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "DisplayIcon" "$INSTDIR\\GlucoseConverter.exe"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "Publisher" "${COMPANYNAME}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "HelpLink" "${HELPURL}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "URLUpdateInfo" "${UPDATEURL}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "URLInfoAbout" "${ABOUTURL}"
-    WriteRegStr HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "DisplayVersion" "${VERSIONMAJOR}.${VERSIONMINOR}.${VERSIONBUILD}"
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "VersionMajor" ${VERSIONMAJOR}
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "VersionMinor" ${VERSIONMINOR}
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "NoModify" 1
-    WriteRegDWORD HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}" "NoRepair" 1
-    
-SectionEnd
-
-Section "uninstall"
-    Delete "$INSTDIR\\GlucoseConverter.exe"
-    Delete "$INSTDIR\\uninstall.exe"
-    
-    Delete "$SMPROGRAMS\\${APPNAME}\\${APPNAME}.lnk"
-    Delete "$SMPROGRAMS\\${APPNAME}\\Uninstall.lnk"
-    RmDir "$SMPROGRAMS\\${APPNAME}"
-    
-    Delete "$DESKTOP\\${APPNAME}.lnk"
-    
-    DeleteRegKey HKLM "Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\${APPNAME}"
+    if portable:
+        install_files = 'File "dist\\GlucoseConverter.exe"'
+    else:
+        install_files = 'File /r "dist\\GlucoseConverter\\*"'
     
-    RmDir $INSTDIR
-SectionEnd
-"""
+    nsis_script = render_template('installer.nsi.tmpl', INSTALL_FILES=install_files)
     
     with open('installer.nsi', 'w') as f:
         f.write(nsis_script)
@@ -255,6 +204,13 @@ if errorlevel 1 (
 
 def main():
     """Main build process"""
+    parser = argparse.ArgumentParser(description='Build the Glucose Converter executable')
+    parser.add_argument('--portable', action='store_true',
+                        help='Build a single-file executable instead of a folder')
+    parser.add_argument('--compress', action='store_true',
+                        help='Compress binaries with UPX (smaller, slower startup)')
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("Glucose Converter - Build Executable")
     print("=" * 50)
@@ -268,7 +224,7 @@ def main():
     check_requirements()
     
     # Build executable
-    exe_path = build_executable()
+    exe_path = build_executable(portable=args.portable, compress=args.compress)
     
     if exe_path:
         print("\n" + "=" * 50)
@@ -277,12 +233,15 @@ def main():
         print(f"\nExecutable location: {exe_path}")
         print("\nYou can now:")
         print("1. Run the executable directly")
-        print("2. Copy it to any Windows computer")
+        if args.portable:
+            print("2. Copy it to any Windows computer")
+        else:
+            print("2. Copy the whole GlucoseConverter folder to any Windows computer")
         print("3. Create shortcuts as needed")
         
         # Create additional files
         create_batch_launcher()
-        create_installer_script()
+        create_installer_script(portable=args.portable)
         
         print("\nAdditional files created:")
         print("- run_glucose_converter.bat (for running from source)")
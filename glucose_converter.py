@@ -7,16 +7,112 @@ Purpose: Converts CSV glucose data to color-coded XLSX format
 
 import os
 import sys
+import re
 import csv
+import math
+import bisect
+import shutil
+import hashlib
+import zipfile
 import argparse
 import configparser
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, Callable
 import openpyxl
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; statistics fall back to pure Python
+    np = None
+
+
+# Read buffer for CSV input; large exports are read in a few big chunks
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+# Block size PyArrow tokenizes the CSV in, when it is installed
+_ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Rows read or written between calls to a conversion progress callback
+_PROGRESS_STEP = 1000
+
+# Share of conversion progress given to reading the CSV; writing the rows
+# takes most of the time
+_READ_PROGRESS_SHARE = 20
+
+# Minimum number of readings before statistics are computed with NumPy
+_NUMPY_MIN_READINGS = 5000
+
+def _default_cache_dir() -> Path:
+    """Per-user cache folder for the current platform"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+        return Path(base) / 'GlucoseConverter' / 'Cache'
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Caches' / 'glucose_converter'
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'glucose_converter'
+
+
+# Opt-in cache of finished conversions, keyed on the CSV's path, size and
+# modification time together with the output settings
+_CACHE_DIR = _default_cache_dir()
+_CACHE_MAX_BYTES = 100 * 1024 * 1024
+# Bump whenever the XLSX output changes, so older cached results are not reused
+_CACHE_VERSION = 1
+_CACHE_CONFIG_KEYS = (
+    'date_format',
+    'low_threshold',
+    'high_threshold',
+    'very_high_threshold',
+    'compress_output'
+)
+
+# Contour CSV columns, in the order iter_csv unpacks them
+_CSV_COLUMNS = (
+    'Date and Time',
+    'Readings [mmol/L]',
+    'Meal Marker',
+    'Notes',
+    'Activity',
+    'Meal[g]',
+    'Medication',
+    'Location'
+)
+
+# Contour date format "DD.M.YY. H:MM" (trailing dot and time are optional)
+_DATE_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})\.?(?:\s+(\d{1,2})(?::(\d{1,2}))?)?$')
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow():
+    """Import PyArrow and its CSV reader on first use
+    
+    Returns ``(None, None)`` when it is not installed. Importing Arrow takes
+    longer than converting a typical export, so it is left out of module import.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # PyArrow is optional; CSV files are read with the csv module
+        return None, None
+    return pa, pacsv
+
+
+def _date_formatter(date_format: str) -> Callable[[datetime], str]:
+    """Return a function formatting datetimes with ``date_format``
+    
+    The default format is rendered with an f-string, which is several times
+    faster than ``strftime``; any other format falls back to ``strftime``.
+    """
+    if date_format == '%d.%m.%Y %H:%M':
+        return lambda dt: f"{dt.day:02d}.{dt.month:02d}.{dt.year:04d} {dt.hour:02d}:{dt.minute:02d}"
+    return lambda dt: dt.strftime(date_format)
 
 
 class GlucoseConverter:
@@ -29,6 +125,39 @@ class GlucoseConverter:
         'very_high': 'E6D9FF'  # Light purple for > 17.9
     }
     
+    # Shared style objects, built once and reused for every cell
+    _HEADER_FONT = Font(bold=True, size=11)
+    _HEADER_FILL = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+    _TITLE_FONT = Font(bold=True, size=12)
+    _BOLD_FONT = Font(bold=True)
+    _ALIGN_LEFT = Alignment(horizontal='left', vertical='center')
+    _ALIGN_CENTER = Alignment(horizontal='center', vertical='center')
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _FILLS = {
+        level: PatternFill(start_color=color, end_color=color, fill_type='solid')
+        for level, color in COLORS.items()
+    }
+    
+    # Colors and fills indexed by range: low, normal, high, very high
+    _RANGE_COLORS = (COLORS['low'], None, COLORS['high'], COLORS['very_high'])
+    _RANGE_FILLS = (_FILLS['low'], None, _FILLS['high'], _FILLS['very_high'])
+    
+    # Config keys read from the [Settings] section and their value types
+    _CONFIG_SCHEMA = (
+        ('output_folder', str),
+        ('auto_open', bool),
+        ('low_threshold', float),
+        ('high_threshold', float),
+        ('very_high_threshold', float),
+        ('compress_output', bool),
+        ('use_cache', bool),
+    )
+    
     def __init__(self, config_file: Optional[str] = None):
         """Initialize converter with optional config file"""
         self.config = self._load_config(config_file)
@@ -41,100 +170,189 @@ class GlucoseConverter:
             'date_format': '%d.%m.%Y %H:%M',
             'low_threshold': 4.0,
             'high_threshold': 11.9,
-            'very_high_threshold': 17.9
+            'very_high_threshold': 17.9,
+            'compress_output': True,  # False stores the XLSX uncompressed (faster save, larger file)
+            'use_cache': False  # Reuse the previous output for an unchanged CSV
         }
         
-        if config_file and os.path.exists(config_file):
-            parser = configparser.ConfigParser()
-            parser.read(config_file)
-            
-            if 'Settings' in parser:
-                settings = parser['Settings']
-                if 'output_folder' in settings:
-                    config['output_folder'] = settings['output_folder']
-                if 'auto_open' in settings:
-                    config['auto_open'] = settings.getboolean('auto_open')
-                if 'low_threshold' in settings:
-                    config['low_threshold'] = float(settings['low_threshold'])
-                if 'high_threshold' in settings:
-                    config['high_threshold'] = float(settings['high_threshold'])
-                if 'very_high_threshold' in settings:
-                    config['very_high_threshold'] = float(settings['very_high_threshold'])
+        # ConfigParser.read() skips missing files and returns the ones it read
+        parser = configparser.ConfigParser()
+        if config_file and parser.read(config_file) and 'Settings' in parser:
+            settings = parser['Settings']
+            for key, value_type in self._CONFIG_SCHEMA:
+                value = settings.get(key)
+                if value is None:
+                    continue
+                if value_type is bool:
+                    config[key] = settings.getboolean(key)
+                else:
+                    config[key] = value_type(value)
         
         return config
     
     def read_csv(self, csv_path: str) -> List[Dict]:
         """Read CSV file and return data as list of dictionaries"""
-        data = []
+        return list(self.iter_csv(csv_path))
+    
+    def iter_csv(self, csv_path: str,
+                 progress: Optional[Callable[[int], None]] = None) -> Iterator[Dict]:
+        """Yield parsed readings from the CSV file one row at a time
+        
+        ``progress`` is called with the number of bytes read so far.
+        """
+        # Let PyArrow tokenize the file when it is installed
+        pa, pacsv = _load_pyarrow()
+        if pacsv is not None:
+            try:
+                return self._parse_rows(self._arrow_rows(csv_path, progress))
+            except pa.ArrowInvalid:
+                # e.g. ragged rows, which the csv path pads with blanks
+                pass
+        return self._parse_rows(self._csv_rows(csv_path, progress))
+    
+    def _csv_rows(self, csv_path: str, progress: Optional[Callable[[int], None]] = None
+                  ) -> Iterator[Tuple[str, ...]]:
+        """Yield the raw values of ``_CSV_COLUMNS`` for each row of the file
+        
+        ``progress`` is called with the byte offset every ``_PROGRESS_STEP`` rows.
+        """
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='',
+                  buffering=_CSV_BUFFER_SIZE) as csvfile:
+            # utf-8-sig skips the BOM if present
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            
+            # Resolve column positions once; missing columns point at a blank
+            # cell appended to every row
+            width = len(header)
+            positions = {name: idx for idx, name in enumerate(header)}
+            (date_idx, glucose_idx, meal_marker_idx, notes_idx, activity_idx,
+             meal_idx, medication_idx, location_idx) = (
+                positions.get(name, width) for name in _CSV_COLUMNS
+            )
+            
+            # The text layer does not allow tell() while iterating; the
+            # binary buffer below it does
+            tell = csvfile.buffer.tell
+            
+            for row_num, row in enumerate(reader, 1):
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ('',)
+                yield (row[date_idx], row[glucose_idx], row[meal_marker_idx], row[notes_idx],
+                       row[activity_idx], row[meal_idx], row[medication_idx], row[location_idx])
+                
+                if progress and row_num % _PROGRESS_STEP == 0:
+                    progress(tell())
+    
+    def _arrow_rows(self, csv_path: str, progress: Optional[Callable[[int], None]] = None
+                    ) -> Iterator[Tuple[str, ...]]:
+        """Return the raw values of ``_CSV_COLUMNS`` for each row, parsed by PyArrow
+        
+        The file is read in one go, so ``progress`` is called once with its size.
+        """
+        pa, pacsv = _load_pyarrow()
+        
+        # Read the header with the csv module so the BOM and quoting are handled
+        # exactly as on the fallback path
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        
+        # Keep every column as text; values are parsed like on the csv path
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(column_names=header, skip_rows=1,
+                                           block_size=_ARROW_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False
+            )
+        )
+        
+        if progress:
+            progress(os.path.getsize(csv_path))
         
-        with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
-            # Skip BOM if present
-            reader = csv.DictReader(csvfile)
+        blank = [''] * table.num_rows
+        columns = [
+            table.column(name).to_pylist() if name in header else blank
+            for name in _CSV_COLUMNS
+        ]
+        return zip(*columns)
+    
+    def _parse_rows(self, rows: Iterable[Tuple[str, ...]]) -> Iterator[Dict]:
+        """Turn raw ``_CSV_COLUMNS`` values into readings"""
+        for (date_str, glucose_str, meal_marker, notes, activity,
+             meal, medication, location) in rows:
+            # Parse the date format from CSV (format: "14.5.25. 6:31")
+            date_str = date_str.strip()
+            glucose_str = glucose_str.strip()
             
-            for row in reader:
-                # Parse the date format from CSV (format: "14.5.25. 6:31")
-                date_str = row.get('Date and Time', '').strip()
-                glucose_str = row.get('Readings [mmol/L]', '').strip()
+            if date_str and glucose_str:
+                # Parse date: "DD.M.YY. H:MM" format
+                match = _DATE_RE.match(date_str)
+                if not match:
+                    print(f"Warning: Could not parse row with date '{date_str}'")
+                    continue
                 
-                if date_str and glucose_str:
-                    try:
-                        # Parse date: "DD.M.YY. H:MM" format
-                        # Need to handle the year format (25 -> 2025)
-                        parts = date_str.split(' ')
-                        date_part = parts[0].rstrip('.')
-                        time_part = parts[1] if len(parts) > 1 else '00:00'
-                        
-                        # Split date components
-                        date_components = date_part.split('.')
-                        if len(date_components) == 3:
-                            day = int(date_components[0])
-                            month = int(date_components[1])
-                            year = int(date_components[2])
-                            # Convert 2-digit year to 4-digit
-                            if year < 100:
-                                year = 2000 + year
-                            
-                            # Parse time
-                            time_components = time_part.split(':')
-                            hour = int(time_components[0])
-                            minute = int(time_components[1]) if len(time_components) > 1 else 0
-                            
-                            # Create datetime object
-                            dt = datetime(year, month, day, hour, minute)
-                            
-                            data.append({
-                                'datetime': dt,
-                                'glucose': float(glucose_str),
-                                'meal_marker': row.get('Meal Marker', ''),
-                                'notes': row.get('Notes', ''),
-                                'activity': row.get('Activity', ''),
-                                'meal': row.get('Meal[g]', ''),
-                                'medication': row.get('Medication', ''),
-                                'location': row.get('Location', '')
-                            })
-                    except (ValueError, IndexError) as e:
-                        print(f"Warning: Could not parse row with date '{date_str}': {e}")
-                        continue
-        
-        return data
+                try:
+                    day, month, year, hour, minute = match.groups()
+                    year = int(year)
+                    # Convert 2-digit year to 4-digit
+                    if year < 100:
+                        year = 2000 + year
+                    
+                    # Create datetime object
+                    dt = datetime(year, int(month), int(day),
+                                  int(hour or 0), int(minute or 0))
+                    
+                    reading = {
+                        'datetime': dt,
+                        'glucose': float(glucose_str),
+                        'meal_marker': meal_marker,
+                        'notes': notes,
+                        'activity': activity,
+                        'meal': meal,
+                        'medication': medication,
+                        'location': location
+                    }
+                except ValueError as e:
+                    print(f"Warning: Could not parse row with date '{date_str}': {e}")
+                    continue
+                
+                yield reading
+    
+    def _threshold_bounds(self) -> Tuple[float, float, float]:
+        """Sorted range bounds for bisect lookups against the current config"""
+        # Readings equal to the low threshold count as normal, so shift the
+        # low bound just below it to keep a single bisect_left lookup
+        return (
+            math.nextafter(self.config['low_threshold'], -math.inf),
+            self.config['high_threshold'],
+            self.config['very_high_threshold']
+        )
     
     def get_cell_color(self, glucose_value: float) -> Optional[str]:
         """Determine cell background color based on glucose value"""
-        if glucose_value < self.config['low_threshold']:
-            return self.COLORS['low']
-        elif glucose_value > self.config['very_high_threshold']:
-            return self.COLORS['very_high']
-        elif glucose_value > self.config['high_threshold']:
-            return self.COLORS['high']
-        return None
+        return self._RANGE_COLORS[bisect.bisect_left(self._threshold_bounds(), glucose_value)]
+    
+    def get_cell_fill(self, glucose_value: float) -> Optional[PatternFill]:
+        """Return the shared fill for a glucose value, or None if in range"""
+        return self._RANGE_FILLS[bisect.bisect_left(self._threshold_bounds(), glucose_value)]
     
-    def create_xlsx(self, data: List[Dict], output_path: str):
-        """Create formatted XLSX file from glucose data"""
+    def create_xlsx(self, data: Iterable[Dict], output_path: str,
+                    progress: Optional[Callable[[int], None]] = None) -> int:
+        """Create formatted XLSX file from glucose data
         
-        # Create workbook and worksheet
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Glucose Readings"
+        ``data`` may be any iterable of readings (e.g. ``iter_csv``); it is
+        consumed once. ``progress`` is called with the percentage of data rows
+        written every ``_PROGRESS_STEP`` rows. Returns the number of readings
+        written.
+        """
+        
+        # Create a write-only workbook so rows are streamed to disk instead of
+        # keeping every cell object in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Glucose Readings")
         
         # Define headers
         headers = [
@@ -148,130 +366,162 @@ class GlucoseConverter:
             'Location'
         ]
         
-        # Style definitions
-        header_font = Font(bold=True, size=11)
-        header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Border style
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # Write data rows
-        for row_idx, row_data in enumerate(data, 2):
-            # Date and Time column
-            date_cell = ws.cell(
-                row=row_idx, 
-                column=1, 
-                value=row_data['datetime'].strftime(self.config['date_format'])
-            )
-            date_cell.border = thin_border
-            date_cell.alignment = Alignment(horizontal='left', vertical='center')
-            
-            # Glucose value column with color coding
-            glucose_cell = ws.cell(row=row_idx, column=2, value=row_data['glucose'])
-            glucose_cell.border = thin_border
-            glucose_cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            # Apply color based on glucose level
-            color = self.get_cell_color(row_data['glucose'])
-            if color:
-                glucose_cell.fill = PatternFill(
-                    start_color=color, 
-                    end_color=color, 
-                    fill_type='solid'
-                )
-            
-            # Other columns
-            other_values = [
-                row_data['meal_marker'],
-                row_data['notes'],
-                row_data['activity'],
-                row_data['meal'],
-                row_data['medication'],
-                row_data['location']
+        # Prepare row values up front; write-only sheets do not allow column
+        # widths to be changed once rows have been appended
+        format_date = _date_formatter(self.config['date_format'])
+        rows = []
+        glucose_values = []
+        widths = [len(header) for header in headers]
+        for row_data in data:
+            glucose = row_data['glucose']
+            row_values = [
+                format_date(row_data['datetime']),
+                glucose,
+                row_data['meal_marker'] or '',
+                row_data['notes'] or '',
+                row_data['activity'] or '',
+                row_data['meal'] or '',
+                row_data['medication'] or '',
+                row_data['location'] or ''
             ]
+            rows.append(row_values)
+            glucose_values.append(glucose)
             
-            for col_idx, value in enumerate(other_values, 3):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value if value else '')
-                cell.border = thin_border
-                cell.alignment = Alignment(horizontal='left', vertical='center')
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            # Set column width with minimum and maximum limits
-            adjusted_width = min(max(max_length + 2, 10), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            # Track the widest value per column as rows are built
+            for col_idx, value in enumerate(row_values):
+                length = len(value) if col_idx != 1 else len(str(glucose))
+                if length > widths[col_idx]:
+                    widths[col_idx] = length
+        
+        total_readings = len(rows)
+        if not total_readings:
+            raise ValueError("No valid data found in CSV file")
         
-        # Add summary statistics at the bottom
-        last_row = len(data) + 3
+        avg_glucose, min_glucose, max_glucose, range_indexes, range_counts = \
+            self._summarize(glucose_values)
+        low_count, normal_count, high_count, very_high_count = range_counts
         
-        # Calculate statistics
-        glucose_values = [d['glucose'] for d in data]
-        avg_glucose = sum(glucose_values) / len(glucose_values) if glucose_values else 0
-        min_glucose = min(glucose_values) if glucose_values else 0
-        max_glucose = max(glucose_values) if glucose_values else 0
+        # Auto-adjust column widths with minimum and maximum limits
+        for col_idx, max_length in enumerate(widths, 1):
+            adjusted_width = min(max(max_length + 2, 10), 50)
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+        
+        # Register cell styles once; cells then reference them by name instead
+        # of resolving font/fill/border/alignment individually
+        wb.add_named_style(NamedStyle(
+            'header',
+            font=self._HEADER_FONT,
+            fill=self._HEADER_FILL,
+            alignment=self._ALIGN_CENTER,
+            border=self._THIN_BORDER
+        ))
+        wb.add_named_style(NamedStyle('data_left', alignment=self._ALIGN_LEFT, border=self._THIN_BORDER))
+        wb.add_named_style(NamedStyle('data_center', alignment=self._ALIGN_CENTER, border=self._THIN_BORDER))
         
-        # Count readings in different ranges
-        low_count = sum(1 for v in glucose_values if v < self.config['low_threshold'])
-        normal_count = sum(1 for v in glucose_values if self.config['low_threshold'] <= v <= self.config['high_threshold'])
-        high_count = sum(1 for v in glucose_values if self.config['high_threshold'] < v <= self.config['very_high_threshold'])
-        very_high_count = sum(1 for v in glucose_values if v > self.config['very_high_threshold'])
+        # Write headers
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = 'header'
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Write data rows
+        for row_num, (row_values, range_index) in enumerate(zip(rows, range_indexes), 1):
+            row_cells = []
+            for col_idx, value in enumerate(row_values):
+                cell = WriteOnlyCell(ws, value=value)
+                
+                if col_idx == 1:
+                    # Glucose value column with color coding
+                    cell.style = 'data_center'
+                    fill = self._RANGE_FILLS[range_index]
+                    if fill:
+                        cell.fill = fill
+                else:
+                    cell.style = 'data_left'
+                
+                row_cells.append(cell)
+            ws.append(row_cells)
+            
+            if progress and row_num % _PROGRESS_STEP == 0:
+                progress(row_num * 100 // total_readings)
         
-        # Write statistics
-        stats_start_row = last_row
+        # Add summary statistics at the bottom, separated by an empty row
+        ws.append([])
         
-        ws.cell(row=stats_start_row, column=1, value='STATISTICS').font = Font(bold=True, size=12)
+        title_cell = WriteOnlyCell(ws, value='STATISTICS')
+        title_cell.font = self._TITLE_FONT
+        ws.append([title_cell])
         
         stats = [
-            ('Total Readings:', len(data)),
+            ('Total Readings:', total_readings),
             ('Average Glucose:', f'{avg_glucose:.1f} mmol/L'),
             ('Minimum Glucose:', f'{min_glucose:.1f} mmol/L'),
             ('Maximum Glucose:', f'{max_glucose:.1f} mmol/L'),
             ('', ''),  # Empty row
             ('RANGE DISTRIBUTION:', ''),
-            (f'Low (< {self.config["low_threshold"]} mmol/L):', f'{low_count} ({low_count/len(data)*100:.1f}%)'),
-            (f'Normal ({self.config["low_threshold"]}-{self.config["high_threshold"]} mmol/L):', f'{normal_count} ({normal_count/len(data)*100:.1f}%)'),
-            (f'High ({self.config["high_threshold"]}-{self.config["very_high_threshold"]} mmol/L):', f'{high_count} ({high_count/len(data)*100:.1f}%)'),
-            (f'Very High (> {self.config["very_high_threshold"]} mmol/L):', f'{very_high_count} ({very_high_count/len(data)*100:.1f}%)')
+            (f'Low (< {self.config["low_threshold"]} mmol/L):', f'{low_count} ({low_count/total_readings*100:.1f}%)'),
+            (f'Normal ({self.config["low_threshold"]}-{self.config["high_threshold"]} mmol/L):', f'{normal_count} ({normal_count/total_readings*100:.1f}%)'),
+            (f'High ({self.config["high_threshold"]}-{self.config["very_high_threshold"]} mmol/L):', f'{high_count} ({high_count/total_readings*100:.1f}%)'),
+            (f'Very High (> {self.config["very_high_threshold"]} mmol/L):', f'{very_high_count} ({very_high_count/total_readings*100:.1f}%)')
         ]
         
-        for idx, (label, value) in enumerate(stats, 1):
-            label_cell = ws.cell(row=stats_start_row + idx, column=1, value=label)
-            value_cell = ws.cell(row=stats_start_row + idx, column=2, value=value)
-            
+        for label, value in stats:
+            label_cell = WriteOnlyCell(ws, value=label)
             if 'STATISTICS' in label or 'DISTRIBUTION' in label:
-                label_cell.font = Font(bold=True)
+                label_cell.font = self._BOLD_FONT
+            ws.append([label_cell, value])
         
         # Save the workbook
-        wb.save(output_path)
+        self._save_workbook(wb, output_path)
         print(f"✅ Successfully created XLSX file: {output_path}")
         
         # Auto-open if configured
         if self.config['auto_open']:
             self._open_file(output_path)
+        
+        return total_readings
+    
+    def _summarize(self, glucose_values: List[float]) -> Tuple[float, float, float, List[int], List[int]]:
+        """Return average, min, max, per-reading range index and range counts
+        
+        Range indexes follow ``_RANGE_FILLS``: low, normal, high, very high.
+        """
+        bounds = self._threshold_bounds()
+        
+        if np is not None and len(glucose_values) >= _NUMPY_MIN_READINGS:
+            values = np.fromiter(glucose_values, dtype=np.float64, count=len(glucose_values))
+            indexes = np.searchsorted(bounds, values, side='left')
+            return (
+                float(values.mean()),
+                float(values.min()),
+                float(values.max()),
+                indexes.tolist(),
+                np.bincount(indexes, minlength=4).tolist()
+            )
+        
+        range_indexes = [bisect.bisect_left(bounds, v) for v in glucose_values]
+        range_counts = [0, 0, 0, 0]
+        for range_index in range_indexes:
+            range_counts[range_index] += 1
+        
+        return (
+            sum(glucose_values) / len(glucose_values),
+            min(glucose_values),
+            max(glucose_values),
+            range_indexes,
+            range_counts
+        )
+    
+    def _save_workbook(self, wb: Workbook, output_path: str):
+        """Save the workbook, skipping zip compression if configured"""
+        if self.config['compress_output']:
+            wb.save(output_path)
+            return
+        
+        archive = zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED, allowZip64=True)
+        ExcelWriter(wb, archive).save()
     
     def _open_file(self, filepath: str):
         """Open the file with the default system application"""
@@ -285,8 +535,13 @@ class GlucoseConverter:
         else:  # Linux
             subprocess.run(['xdg-open', filepath])
     
-    def convert(self, csv_path: str, output_path: Optional[str] = None) -> str:
-        """Main conversion method"""
+    def convert(self, csv_path: str, output_path: Optional[str] = None,
+                progress: Optional[Callable[[int], None]] = None) -> str:
+        """Main conversion method
+        
+        ``progress`` is called with the overall percentage done (up to 99)
+        while the CSV is read and while the rows are written.
+        """
         
         # Validate input file
         if not os.path.exists(csv_path):
@@ -309,33 +564,110 @@ class GlucoseConverter:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = output_dir / f"{base_name}_formatted_{timestamp}.xlsx"
         
-        # Read CSV data
+        # Reuse a previous conversion of the same CSV and settings
+        cache_key = self._cache_key(csv_path) if self.config['use_cache'] else None
+        cached_path = self._cache_lookup(cache_key)
+        if cached_path:
+            shutil.copyfile(cached_path, output_path)
+            print(f"♻️  Reused cached conversion: {output_path}")
+            if self.config['auto_open']:
+                self._open_file(str(output_path))
+            return str(output_path)
+        
+        # Stream CSV readings straight into the XLSX writer
         print(f"📖 Reading CSV file: {csv_path}")
-        data = self.read_csv(csv_path)
-        
-        if not data:
-            raise ValueError("No valid data found in CSV file")
+        print(f"📝 Creating formatted XLSX file...")
+        read_progress = write_progress = None
+        if progress:
+            csv_size = os.path.getsize(csv_path) or 1
+            read_progress = lambda offset: progress(offset * _READ_PROGRESS_SHARE // csv_size)
+            write_progress = lambda percent: progress(
+                _READ_PROGRESS_SHARE + percent * (99 - _READ_PROGRESS_SHARE) // 100
+            )
+        readings = self.iter_csv(csv_path, read_progress)
+        count = self.create_xlsx(readings, str(output_path), write_progress)
         
-        print(f"✅ Found {len(data)} glucose readings")
+        print(f"✅ Converted {count} glucose readings")
         
-        # Create XLSX file
-        print(f"📝 Creating formatted XLSX file...")
-        self.create_xlsx(data, str(output_path))
+        self._cache_store(cache_key, str(output_path))
         
         return str(output_path)
+    
+    def _cache_key(self, csv_path: str) -> str:
+        """Key a conversion on the CSV's stat data and the settings that shape the output
+        
+        The CSV itself is not read, so a cache miss costs a single stat.
+        """
+        stat = os.stat(csv_path)
+        key = (
+            _CACHE_VERSION,
+            openpyxl.__version__,
+            os.path.abspath(csv_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            [(name, self.config[name]) for name in _CACHE_CONFIG_KEYS]
+        )
+        return hashlib.blake2b(repr(key).encode(), digest_size=20).hexdigest()
+    
+    def _cache_lookup(self, cache_key: Optional[str]) -> Optional[Path]:
+        """Return the cached XLSX for a key, marking it as recently used"""
+        if not cache_key:
+            return None
+        
+        cached_path = _CACHE_DIR / f"{cache_key}.xlsx"
+        try:
+            os.utime(cached_path)
+        except OSError:
+            return None
+        return cached_path
+    
+    def _cache_store(self, cache_key: Optional[str], output_path: str):
+        """Copy a finished conversion into the cache and prune old entries"""
+        if not cache_key:
+            return
+        
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, _CACHE_DIR / f"{cache_key}.xlsx")
+            
+            # Drop least recently used entries once the cache grows too large
+            with os.scandir(_CACHE_DIR) as entries:
+                cached = sorted(
+                    (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.xlsx') and entry.is_file()
+                )
+            total_size = sum(size for _, size, _ in cached)
+            for _, size, path in cached:
+                if total_size <= _CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total_size -= size
+        except OSError as e:
+            print(f"Warning: Could not update conversion cache: {e}")
 
 
 def find_latest_csv(folder_path: str) -> Optional[str]:
     """Find the most recent Contour CSV file in a folder"""
-    folder = Path(folder_path)
-    csv_files = list(folder.glob('ContourCSVReport*.csv'))
+    latest_path = None
+    latest_mtime = None
     
-    if not csv_files:
+    try:
+        with os.scandir(folder_path) as entries:
+            # Track the newest file in one pass instead of collecting them all;
+            # DirEntry caches stat results, so each file is stat'ed once
+            for entry in entries:
+                if (entry.name.startswith('ContourCSVReport')
+                        and entry.name.endswith('.csv')
+                        and entry.is_file()):
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_mtime = mtime
+                        latest_path = entry.path
+    except FileNotFoundError:
         return None
     
-    # Sort by modification time
-    csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    return str(csv_files[0])
+    return latest_path
 
 
 def main():
@@ -387,6 +719,13 @@ auto_open = false
 low_threshold = 4.0
 high_threshold = 11.9
 very_high_threshold = 17.9
+
+# Compress the XLSX file (set to false for faster saves of larger files)
+compress_output = true
+
+# Reuse the previous result when the same CSV is converted again
+# (keeps a copy of each converted file in the user's cache folder)
+use_cache = false
 """
         config_path = 'glucose_config.ini'
         with open(config_path, 'w') as f:
@@ -7,61 +7,283 @@ Purpose: Converts CSV glucose data to color-coded XLSX format with advanced feat
 
 import os
 import sys
+import re
 import csv
 import json
 import platform
 import argparse
 import configparser
+import math
 import shutil
+import zipfile
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache, partial
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterator, Iterable, Callable
 import openpyxl
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # ciso8601 is optional; ISO dates fall back to the stdlib parser
+    parse_datetime = datetime.fromisoformat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; statistics fall back to pure Python
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: lock the tracker with msvcrt instead
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the tracker falls back to the json module
+    orjson = None
+
+
+# Contour date format "DD.M.YY. H:MM" (trailing dot and time are optional)
+_DATE_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})\.?(?:\s+(\d{1,2})(?::(\d{1,2}))?)?$')
+
+# Minimum number of readings before statistics are computed with NumPy
+_NUMPY_MIN_READINGS = 5000
+
+# Rows parsed per batch when streaming a CSV file
+_CSV_CHUNK_SIZE = 50000
+
+# CSV columns read by the converter, in the order they are unpacked
+_CSV_COLUMNS = (
+    'Date and Time',
+    'Readings [mmol/L]',
+    'Meal Marker',
+    'Notes',
+    'Activity',
+    'Meal[g]',
+    'Medication',
+    'Location'
+)
+
+# Static parts of the XLSX package written by _write_xlsx_raw
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Glucose Readings" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# Cell formats: 0 default, 1 header, 2 bordered data, 3 low, 4 high,
+# 5 very high, 6 statistics title, 7 bold label
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="12"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="6">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFD3D3D3"/><bgColor rgb="FFD3D3D3"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFE6F2FF"/><bgColor rgb="FFE6F2FF"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFFFCCCC"/><bgColor rgb="FFFFCCCC"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFE6D9FF"/><bgColor rgb="FFE6D9FF"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="8">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="3" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="4" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="5" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow():
+    """Import PyArrow and its CSV reader on first use
+    
+    Returns ``(None, None)`` when it is not installed. Importing Arrow takes
+    longer than converting a typical export, so it is left out of module import.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # PyArrow is optional; CSV files are read with the csv module
+        return None, None
+    return pa, pacsv
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize ``obj`` as indented JSON, using orjson when available
+    
+    The tracker stores dates as ISO strings, so no fallback serializer is needed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class ExportTracker:
-    """Tracks export history for incremental exports"""
+    """Tracks export history for incremental exports
+    
+    Each ``update_export`` writes the tracker file right away. Inside a
+    ``with tracker:`` block, updates are kept in memory and written once
+    when the block exits.
+    """
     
     def __init__(self, tracker_file: str = None):
         """Initialize export tracker"""
         self.tracker_file = tracker_file or str(Path.home() / '.glucose_export_tracker.json')
-        self.history = self._load_history()
+        self.autoflush = True
+        self._pending: Dict = {}
+    
+    def __enter__(self):
+        self.autoflush = False
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.autoflush = True
+        self.flush()
+    
+    @cached_property
+    def history(self) -> Dict:
+        """Export history, loaded from file on first access"""
+        return self._load_history()
     
     def _load_history(self) -> Dict:
         """Load export history from file"""
         if os.path.exists(self.tracker_file):
             try:
-                with open(self.tracker_file, 'r') as f:
-                    return json.load(f)
-            except:
+                with open(self.tracker_file, 'rb') as f:
+                    return _load_json(f.read())
+            except (OSError, ValueError):
                 return {}
         return {}
     
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the tracker while writing it
+        
+        Batch conversions update the tracker from several processes at once.
+        """
+        with open(self.tracker_file + '.lock', 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def _write_history(self):
+        """Write export history to file; the caller holds the lock
+        
+        The history goes to a temporary file that then replaces the tracker,
+        so an interrupted write never leaves a truncated tracker behind.
+        """
+        tmp_file = self.tracker_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(_dump_json(self.history))
+        os.replace(tmp_file, self.tracker_file)
+    
     def save_history(self):
         """Save export history to file"""
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.history, f, indent=2, default=str)
+        with self._locked():
+            self._write_history()
     
     def get_last_export_date(self, source_file: str) -> Optional[datetime]:
         """Get the last export date for a specific source file"""
-        if source_file in self.history:
+        record = self.history.get(source_file)
+        if record:
             try:
-                return datetime.fromisoformat(self.history[source_file]['last_export'])
-            except:
+                return datetime.fromisoformat(record['last_export'])
+            except (KeyError, ValueError):
                 return None
         return None
     
     def update_export(self, source_file: str, latest_date: datetime):
         """Update the export record for a file"""
-        self.history[source_file] = {
+        record = {
             'last_export': latest_date.isoformat(),
             'updated_at': datetime.now().isoformat()
         }
-        self.save_history()
+        self.history[source_file] = record
+        self._pending[source_file] = record
+        if self.autoflush:
+            self.flush()
+    
+    def flush(self):
+        """Write export records not yet saved to the tracker file
+        
+        The history is re-read under the lock so records written by other
+        processes in the meantime are kept.
+        """
+        if not self._pending:
+            return
+        with self._locked():
+            self.history = self._load_history()
+            self.history.update(self._pending)
+            self._write_history()
+        self._pending = {}
 
 
 class TemplateManager:
@@ -71,11 +293,18 @@ class TemplateManager:
         """Initialize template manager"""
         self.template_dir = Path(template_dir) if template_dir else Path.home() / '.glucose_templates'
         self.template_dir.mkdir(exist_ok=True)
+        # Bumped whenever a template is saved or deleted, so callers can tell
+        # when a cached template list is stale
+        self.version = 0
     
     def list_templates(self) -> List[str]:
         """List available templates"""
-        templates = list(self.template_dir.glob('*.xlsx'))
-        return [t.stem for t in templates]
+        with os.scandir(self.template_dir) as entries:
+            return [
+                entry.name[:-len('.xlsx')]
+                for entry in entries
+                if entry.name.endswith('.xlsx') and entry.is_file()
+            ]
     
     def get_template_path(self, name: str) -> Optional[Path]:
         """Get path to a template file"""
@@ -86,8 +315,18 @@ class TemplateManager:
         """Save a new template"""
         dest_path = self.template_dir / f"{name}.xlsx"
         shutil.copy2(source_path, dest_path)
+        self.version += 1
         return dest_path
     
+    def delete_template(self, name: str) -> bool:
+        """Delete a template; returns False if it does not exist"""
+        template_path = self.get_template_path(name)
+        if not template_path:
+            return False
+        template_path.unlink()
+        self.version += 1
+        return True
+    
     def load_template(self, name: str) -> Optional[Workbook]:
         """Load a template workbook"""
         template_path = self.get_template_path(name)
@@ -106,11 +345,57 @@ class EnhancedGlucoseConverter:
         'very_high': 'E6D9FF'  # Light purple for > 17.9
     }
     
+    # Shared style objects, built once and reused for every cell
+    _HEADER_FONT = Font(bold=True, size=11)
+    _HEADER_FILL = PatternFill(start_color='FFD3D3D3', end_color='FFD3D3D3', fill_type='solid')
+    _HEADER_ALIGN = Alignment(horizontal='center', vertical='center')
+    _TITLE_FONT = Font(bold=True, size=12)
+    _BOLD_FONT = Font(bold=True)
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # Range fills shared by every glucose cell (8-character ARGB colors)
+    _LOW_FILL = PatternFill(start_color='FFE6F2FF', end_color='FFE6F2FF', fill_type='solid')
+    _HIGH_FILL = PatternFill(start_color='FFFFCCCC', end_color='FFFFCCCC', fill_type='solid')
+    _VERYHIGH_FILL = PatternFill(start_color='FFE6D9FF', end_color='FFE6D9FF', fill_type='solid')
+    
+    HEADERS = [
+        'Date and Time',
+        'Glucose [mmol/L]',
+        'Meal Marker',
+        'Notes',
+        'Activity',
+        'Meal [g]',
+        'Medication',
+        'Location'
+    ]
+    
     def __init__(self, config_file: Optional[str] = None):
-        """Initialize converter with optional config file"""
-        self.config = self._load_config(config_file)
-        self.export_tracker = ExportTracker()
-        self.template_manager = TemplateManager(self.config.get('template_dir'))
+        """Initialize converter with optional config file
+        
+        The config, export tracker and template manager are loaded on first
+        use, so commands that need only one of them skip the other file I/O.
+        """
+        self._config_file = config_file
+    
+    @cached_property
+    def config(self) -> Dict:
+        """Converter settings, loaded from the config file on first access"""
+        return self._load_config(self._config_file)
+    
+    @cached_property
+    def export_tracker(self) -> ExportTracker:
+        """Export history tracker, created on first access"""
+        return ExportTracker()
+    
+    @cached_property
+    def template_manager(self) -> TemplateManager:
+        """Template manager, created on first access"""
+        return TemplateManager(self.config.get('template_dir'))
     
     def _load_config(self, config_file: Optional[str]) -> Dict:
         """Load configuration from file or use defaults"""
@@ -151,62 +436,144 @@ class EnhancedGlucoseConverter:
                  end_date: Optional[datetime] = None) -> List[Dict]:
         """Read CSV file with optional date filtering"""
         data = []
+        # Contour exports are usually already in chronological order
+        is_sorted = True
+        prev_dt = None
         
-        with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
+        # The whole file is loaded anyway, so let PyArrow tokenize it if present
+        rows = None
+        pa, pacsv = _load_pyarrow()
+        if pacsv is not None:
+            try:
+                rows = self._arrow_rows(csv_path)
+            except pa.ArrowInvalid:
+                # e.g. ragged rows, which the csv path pads with blanks
+                rows = None
+        if rows is None:
+            rows = self._csv_rows(csv_path)
+        
+        for reading in self._parse_rows(rows, start_date, end_date):
+            dt = reading['datetime']
+            if prev_dt is not None and dt < prev_dt:
+                is_sorted = False
+            prev_dt = dt
+            data.append(reading)
+        
+        # Sort by datetime unless the rows were already in order
+        if not is_sorted:
+            data.sort(key=itemgetter('datetime'))
+        return data
+    
+    def iter_csv(self, csv_path: str, start_date: Optional[datetime] = None,
+                 end_date: Optional[datetime] = None) -> Iterator[Dict]:
+        """Yield parsed readings in file order, with optional date filtering"""
+        return self._parse_rows(self._csv_rows(csv_path), start_date, end_date)
+    
+    def iter_csv_chunks(self, csv_path: str, chunk_size: int = _CSV_CHUNK_SIZE,
+                        start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None) -> Iterator[List[Dict]]:
+        """Yield parsed readings in file order, in lists of up to ``chunk_size`` rows
+        
+        Memory use is bounded by the chunk size regardless of the file size.
+        """
+        readings = self.iter_csv(csv_path, start_date, end_date)
+        while True:
+            chunk = list(islice(readings, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _csv_rows(self, csv_path: str) -> Iterator[Tuple[str, ...]]:
+        """Yield the raw values of ``_CSV_COLUMNS`` for each CSV row"""
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            
+            # Resolve column positions once; missing columns point at a blank
+            # cell appended to every row
+            width = len(header)
+            positions = {name: idx for idx, name in enumerate(header)}
+            pick_columns = itemgetter(*(positions.get(name, width) for name in _CSV_COLUMNS))
             
             for row in reader:
-                date_str = row.get('Date and Time', '').strip()
-                glucose_str = row.get('Readings [mmol/L]', '').strip()
-                
-                if date_str and glucose_str:
-                    try:
-                        # Parse date: "DD.M.YY. H:MM" format
-                        parts = date_str.split(' ')
-                        date_part = parts[0].rstrip('.')
-                        time_part = parts[1] if len(parts) > 1 else '00:00'
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ('',)
+                yield pick_columns(row)
+    
+    def _arrow_rows(self, csv_path: str) -> Iterator[Tuple[str, ...]]:
+        """Return the raw values of ``_CSV_COLUMNS`` for each row, parsed by PyArrow"""
+        pa, pacsv = _load_pyarrow()
+        
+        # Read the header with the csv module so the BOM and quoting are handled
+        # exactly as on the fallback path
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        
+        # Keep every column as text; values are parsed like on the csv path
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(column_names=header, skip_rows=1),
+            parse_options=pacsv.ParseOptions(delimiter=','),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False
+            )
+        )
+        
+        blank = [''] * table.num_rows
+        columns = [
+            table.column(name).to_pylist() if name in header else blank
+            for name in _CSV_COLUMNS
+        ]
+        return zip(*columns)
+    
+    def _parse_rows(self, rows: Iterable[Tuple[str, ...]], start_date: Optional[datetime] = None,
+                    end_date: Optional[datetime] = None) -> Iterator[Dict]:
+        """Turn raw ``_CSV_COLUMNS`` values into readings, with optional date filtering"""
+        for (date_str, glucose_str, meal_marker, notes, activity,
+             meal, medication, location) in rows:
+            date_str = date_str.strip()
+            glucose_str = glucose_str.strip()
+            
+            if date_str and glucose_str:
+                try:
+                    # Parse date: "DD.M.YY. H:MM" format
+                    match = _DATE_RE.match(date_str)
+                    if match:
+                        day, month, year, hour, minute = match.groups()
+                        year = int(year)
+                        # Convert 2-digit year to 4-digit
+                        if year < 100:
+                            year = 2000 + year
                         
-                        # Split date components
-                        date_components = date_part.split('.')
-                        if len(date_components) == 3:
-                            day = int(date_components[0])
-                            month = int(date_components[1])
-                            year = int(date_components[2])
-                            # Convert 2-digit year to 4-digit
-                            if year < 100:
-                                year = 2000 + year
-                            
-                            # Parse time
-                            time_components = time_part.split(':')
-                            hour = int(time_components[0])
-                            minute = int(time_components[1]) if len(time_components) > 1 else 0
-                            
-                            # Create datetime object
-                            dt = datetime(year, month, day, hour, minute)
-                            
-                            # Apply date filtering
-                            if start_date and dt < start_date:
-                                continue
-                            if end_date and dt > end_date:
-                                continue
-                            
-                            data.append({
-                                'datetime': dt,
-                                'glucose': float(glucose_str),
-                                'meal_marker': row.get('Meal Marker', ''),
-                                'notes': row.get('Notes', ''),
-                                'activity': row.get('Activity', ''),
-                                'meal': row.get('Meal[g]', ''),
-                                'medication': row.get('Medication', ''),
-                                'location': row.get('Location', '')
-                            })
-                    except (ValueError, IndexError) as e:
-                        print(f"Warning: Could not parse row with date '{date_str}': {e}")
+                        dt = datetime(year, int(month), int(day),
+                                      int(hour or 0), int(minute or 0))
+                    else:
+                        # ISO 8601 timestamps, e.g. from re-saved exports
+                        dt = parse_datetime(date_str).replace(tzinfo=None)
+                    
+                    # Apply date filtering
+                    if start_date and dt < start_date:
                         continue
-        
-        # Sort by datetime
-        data.sort(key=lambda x: x['datetime'])
-        return data
+                    if end_date and dt > end_date:
+                        continue
+                    
+                    reading = {
+                        'datetime': dt,
+                        'glucose': float(glucose_str),
+                        'meal_marker': meal_marker,
+                        'notes': notes,
+                        'activity': activity,
+                        'meal': meal,
+                        'medication': medication,
+                        'location': location
+                    }
+                except ValueError as e:
+                    print(f"Warning: Could not parse row with date '{date_str}': {e}")
+                    continue
+                
+                yield reading
     
     def get_cell_color(self, glucose_value: float) -> Optional[str]:
         """Determine cell background color based on glucose value"""
@@ -218,6 +585,36 @@ class EnhancedGlucoseConverter:
             return self.COLORS['high']
         return None
     
+    def get_cell_fill(self, glucose_value: float) -> Optional[PatternFill]:
+        """Return the shared range fill for a glucose value, or None if in range"""
+        return self._fill_picker()(glucose_value)
+    
+    def _fill_picker(self) -> Callable[[float], Optional[PatternFill]]:
+        """Return a function mapping a glucose value directly to its range fill"""
+        return self._range_picker(self._LOW_FILL, self._HIGH_FILL, self._VERYHIGH_FILL)
+    
+    def _range_picker(self, low_value: Any, high_value: Any, very_high_value: Any,
+                      normal_value: Any = None) -> Callable[[float], Any]:
+        """Return a function mapping a glucose value to the value for its range
+        
+        Thresholds are captured once per conversion; the ranges match
+        ``get_cell_color``.
+        """
+        low = self.config['low_threshold']
+        high = self.config['high_threshold']
+        very_high = self.config['very_high_threshold']
+        
+        def pick(glucose_value: float) -> Any:
+            if glucose_value < low:
+                return low_value
+            if glucose_value > very_high:
+                return very_high_value
+            if glucose_value > high:
+                return high_value
+            return normal_value
+        
+        return pick
+    
     def apply_template_formatting(self, ws: Worksheet, template_ws: Worksheet, data_rows: int):
         """Apply formatting from template to worksheet"""
         # Copy column widths
@@ -269,157 +666,409 @@ class EnhancedGlucoseConverter:
                 print(f"📋 Using template: {template_name}")
         
         if template_wb:
-            wb = template_wb
-            ws = wb.active
+            wb = self._create_xlsx_template(template_wb, data)
         else:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Glucose Readings"
-        
-        # Define headers
-        headers = [
-            'Date and Time',
-            'Glucose [mmol/L]',
-            'Meal Marker',
-            'Notes',
-            'Activity',
-            'Meal [g]',
-            'Medication',
-            'Location'
-        ]
+            wb = self._create_xlsx_writeonly(data)
         
-        # Default style definitions (used if no template)
-        if not template_wb:
-            header_font = Font(bold=True, size=11)
-            header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-            header_alignment = Alignment(horizontal='center', vertical='center')
-            
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # Write headers
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
-        else:
-            # Update headers if using template
-            for col, header in enumerate(headers, 1):
-                ws.cell(row=1, column=col, value=header)
+        # Save the workbook
+        wb.save(output_path)
+        print(f"✅ Successfully created XLSX file: {output_path}")
+        
+        # Auto-open if configured
+        if self.config['auto_open']:
+            self._open_file(output_path)
+    
+    def _create_xlsx_writeonly(self, data: List[Dict]) -> Workbook:
+        """Build a workbook with default formatting in write-only mode
+        
+        Rows are streamed to the sheet with ``ws.append`` instead of being kept
+        as cell objects, so memory use stays flat regardless of row count.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Glucose Readings")
+        
+        rows, max_lengths = self._format_rows(data)
+        
+        # Column widths must be set before the first row is appended
+        for col_idx, max_length in enumerate(max_lengths, 1):
+            adjusted_width = min(max(max_length + 2, 10), 50)
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+        
+        # Write headers
+        self._append_header(ws)
         
         # Write data rows
-        for row_idx, row_data in enumerate(data, 2):
-            # Date and Time column
-            date_cell = ws.cell(
-                row=row_idx, 
-                column=1, 
-                value=row_data['datetime'].strftime(self.config['date_format'])
-            )
-            
-            # Glucose value column with color coding
-            glucose_cell = ws.cell(row=row_idx, column=2, value=row_data['glucose'])
-            
-            # Apply color based on glucose level
-            color = self.get_cell_color(row_data['glucose'])
-            if color:
-                glucose_cell.fill = PatternFill(
-                    start_color=color, 
-                    end_color=color, 
-                    fill_type='solid'
-                )
-            
-            # Other columns
-            other_values = [
-                row_data['meal_marker'],
-                row_data['notes'],
-                row_data['activity'],
-                row_data['meal'],
-                row_data['medication'],
-                row_data['location']
+        pick_fill = self._fill_picker()
+        for row_data, row_values in zip(data, rows):
+            self._append_reading(ws, row_values, pick_fill(row_data['glucose']))
+        
+        # Add statistics
+        if data:
+            self._append_statistics(ws, self._statistics_rows(data))
+        
+        return wb
+    
+    def _format_rows(self, data: List[Dict]) -> Tuple[List[list], List[int]]:
+        """Format readings as sheet rows and measure each column on the way
+        
+        Returns the rows and the longest text length per column, headers
+        included, for sizing the columns before any row is written.
+        """
+        date_format = self.config['date_format']
+        max_lengths = [len(header) for header in self.HEADERS]
+        rows = []
+        for row_data in data:
+            row_values = [
+                row_data['datetime'].strftime(date_format),
+                row_data['glucose'],
+                row_data['meal_marker'] or '',
+                row_data['notes'] or '',
+                row_data['activity'] or '',
+                row_data['meal'] or '',
+                row_data['medication'] or '',
+                row_data['location'] or ''
             ]
-            
-            for col_idx, value in enumerate(other_values, 3):
-                ws.cell(row=row_idx, column=col_idx, value=value if value else '')
-            
-            # Apply borders if not using template
-            if not template_wb:
-                for col in range(1, 9):
-                    ws.cell(row=row_idx, column=col).border = thin_border
-        
-        # Auto-adjust column widths if no template
-        if not template_wb:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
+            for col_idx, value in enumerate(row_values):
+                length = len(str(value))
+                if length > max_lengths[col_idx]:
+                    max_lengths[col_idx] = length
+            rows.append(row_values)
+        return rows, max_lengths
+    
+    def _append_header(self, ws):
+        """Append the styled header row to a write-only sheet"""
+        header_cells = []
+        for header in self.HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = self._HEADER_FONT
+            cell.fill = self._HEADER_FILL
+            cell.alignment = self._HEADER_ALIGN
+            cell.border = self._THIN_BORDER
+            header_cells.append(cell)
+        ws.append(header_cells)
+    
+    def _append_reading(self, ws, row_values, fill: Optional[PatternFill]):
+        """Append one bordered data row to a write-only sheet"""
+        cells = [WriteOnlyCell(ws, value=value) for value in row_values]
+        for cell in cells:
+            cell.border = self._THIN_BORDER
+        
+        # Apply color based on glucose level
+        if fill:
+            cells[1].fill = fill
+        
+        ws.append(cells)
+    
+    def _append_statistics(self, ws, stats: List[Tuple[str, Any]]):
+        """Append the statistics summary below one blank row of a write-only sheet"""
+        ws.append([])
+        title_cell = WriteOnlyCell(ws, value='STATISTICS')
+        title_cell.font = self._TITLE_FONT
+        ws.append([title_cell])
+        
+        for label, value in stats:
+            label_cell = WriteOnlyCell(ws, value=label)
+            if 'DISTRIBUTION' in label:
+                label_cell.font = self._BOLD_FONT
+            ws.append([label_cell, value])
+    
+    def stream_convert(self, csv_path: str, output_path: str,
+                       start_date: Optional[datetime] = None,
+                       end_date: Optional[datetime] = None) -> Tuple[int, Optional[datetime]]:
+        """Convert CSV to XLSX in one pass without holding the readings in memory
+        
+        Rows are written in file order as they are parsed and only running
+        totals are kept for the statistics. Since column widths have to be set
+        before the first row, they are sized from the headers and the date
+        format rather than measured. Returns the number of readings written
+        and the latest reading time; nothing is saved if no reading matched.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Glucose Readings")
+        
+        date_format = self.config['date_format']
+        date_length = len(datetime(2000, 12, 31, 23, 59).strftime(date_format))
+        for col_idx, header in enumerate(self.HEADERS, 1):
+            max_length = date_length if col_idx == 1 else len(header)
+            adjusted_width = min(max(max_length + 2, 10), 50)
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+        
+        self._append_header(ws)
+        
+        low = self.config['low_threshold']
+        high = self.config['high_threshold']
+        very_high = self.config['very_high_threshold']
+        pick_fill = self._fill_picker()
+        
+        count = 0
+        total = 0.0
+        min_glucose = math.inf
+        max_glucose = -math.inf
+        low_count = normal_count = high_count = very_high_count = 0
+        first_dt = last_dt = None
+        
+        for chunk in self.iter_csv_chunks(csv_path, start_date=start_date, end_date=end_date):
+            for reading in chunk:
+                dt = reading['datetime']
+                glucose = reading['glucose']
                 
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
+                self._append_reading(ws, (
+                    dt.strftime(date_format),
+                    glucose,
+                    reading['meal_marker'] or '',
+                    reading['notes'] or '',
+                    reading['activity'] or '',
+                    reading['meal'] or '',
+                    reading['medication'] or '',
+                    reading['location'] or ''
+                ), pick_fill(glucose))
                 
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+                total += glucose
+                if glucose < min_glucose:
+                    min_glucose = glucose
+                if glucose > max_glucose:
+                    max_glucose = glucose
+                
+                if glucose < low:
+                    low_count += 1
+                elif glucose <= high:
+                    normal_count += 1
+                elif glucose <= very_high:
+                    high_count += 1
+                else:
+                    very_high_count += 1
+                
+                if first_dt is None or dt < first_dt:
+                    first_dt = dt
+                if last_dt is None or dt > last_dt:
+                    last_dt = dt
+            
+            count += len(chunk)
         
-        # Add statistics
-        self._add_statistics(ws, data, len(data) + 3)
+        if not count:
+            return 0, None
+        
+        self._append_statistics(ws, self._format_statistics(
+            first_dt, last_dt, count, total / count, min_glucose, max_glucose,
+            low_count, normal_count, high_count, very_high_count
+        ))
         
-        # Save the workbook
         wb.save(output_path)
         print(f"✅ Successfully created XLSX file: {output_path}")
         
         # Auto-open if configured
         if self.config['auto_open']:
             self._open_file(output_path)
+        
+        return count, last_dt
+    
+    def _write_xlsx_raw(self, data: List[Dict], output_path: str):
+        """Write the default-formatted workbook as hand-built XLSX XML
+        
+        Bypasses openpyxl for very large exports: the sheet XML is written in
+        batches into the ZIP container using inline strings, without row and
+        cell references and without style attributes on unstyled cells. Rows
+        are formatted up front by ``_format_rows``, so memory still grows with
+        the row count. The result matches ``_create_xlsx_writeonly``, except
+        that NaN and infinite values are written as text; ``<v>`` only allows
+        finite numbers.
+        """
+        rows, max_lengths = self._format_rows(data)
+        
+        def cell(value: Any, style: int = 0) -> str:
+            style_attr = f' s="{style}"' if style else ''
+            if value is None or value == '':
+                return f'<c{style_attr}/>'
+            if isinstance(value, (int, float)) and math.isfinite(value):
+                return f'<c{style_attr}><v>{value!r}</v></c>'
+            text = escape(str(value))
+            space = ' xml:space="preserve"' if text != text.strip() else ''
+            return f'<c t="inlineStr"{style_attr}><is><t{space}>{text}</t></is></c>'
+        
+        pick_style = self._range_picker(3, 4, 5, 2)
+        
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+            archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK)
+            archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+            archive.writestr('xl/styles.xml', _XLSX_STYLES)
+            
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                write = sheet.write
+                
+                # Column widths, sized like the openpyxl path
+                cols = []
+                for col_idx, max_length in enumerate(max_lengths, 1):
+                    adjusted_width = min(max(max_length + 2, 10), 50)
+                    cols.append(f'<col min="{col_idx}" max="{col_idx}" width="{adjusted_width}" customWidth="1"/>')
+                
+                write((
+                    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                    f'<cols>{"".join(cols)}</cols><sheetData>'
+                    f'<row>{"".join(cell(header, 1) for header in self.HEADERS)}</row>'
+                ).encode('utf-8'))
+                
+                # Data rows, flushed in batches
+                batch = []
+                for row_values in rows:
+                    batch.append(
+                        '<row>'
+                        + cell(row_values[0], 2)
+                        + cell(row_values[1], pick_style(row_values[1]))
+                        + ''.join(cell(value, 2) for value in row_values[2:])
+                        + '</row>'
+                    )
+                    if len(batch) >= 1000:
+                        write(''.join(batch).encode('utf-8'))
+                        batch = []
+                
+                # Statistics below one blank row
+                if data:
+                    batch.append(f'<row/><row>{cell("STATISTICS", 6)}</row>')
+                    for label, value in self._statistics_rows(data):
+                        label_style = 7 if 'DISTRIBUTION' in label else 0
+                        batch.append(f'<row>{cell(label, label_style)}{cell(value)}</row>')
+                
+                batch.append('</sheetData></worksheet>')
+                write(''.join(batch).encode('utf-8'))
+    
+    def _create_xlsx_template(self, wb: Workbook, data: List[Dict]) -> Workbook:
+        """Fill the active sheet of a template workbook with data"""
+        ws = wb.active
+        
+        # Update headers, leaving cells that already match the template alone
+        for col, header in enumerate(self.HEADERS, 1):
+            cell = ws.cell(row=1, column=col)
+            if cell.value != header:
+                cell.value = header
+        
+        # A template that only styles the header row gets each reading appended
+        # as one row; otherwise write cell by cell so pre-styled rows keep
+        # their formatting
+        append_rows = ws.max_row <= 1
+        
+        date_format = self.config['date_format']
+        pick_fill = self._fill_picker()
+        
+        # Write data rows
+        for row_idx, row_data in enumerate(data, 2):
+            row_values = (
+                row_data['datetime'].strftime(date_format),
+                row_data['glucose'],
+                row_data['meal_marker'] or '',
+                row_data['notes'] or '',
+                row_data['activity'] or '',
+                row_data['meal'] or '',
+                row_data['medication'] or '',
+                row_data['location'] or ''
+            )
+            
+            if append_rows:
+                ws.append(row_values)
+            else:
+                for col_idx, value in enumerate(row_values, 1):
+                    ws.cell(row=row_idx, column=col_idx, value=value)
+            
+            # Apply color based on glucose level
+            fill = pick_fill(row_data['glucose'])
+            if fill:
+                ws.cell(row=row_idx, column=2).fill = fill
+        
+        # Add statistics
+        self._add_statistics(ws, data, len(data) + 3)
+        
+        return wb
     
     def _add_statistics(self, ws: Worksheet, data: List[Dict], start_row: int):
         """Add statistics summary to worksheet"""
         if not data:
             return
         
-        glucose_values = [d['glucose'] for d in data]
-        avg_glucose = sum(glucose_values) / len(glucose_values)
-        min_glucose = min(glucose_values)
-        max_glucose = max(glucose_values)
+        ws.cell(row=start_row, column=1, value='STATISTICS').font = self._TITLE_FONT
+        
+        for idx, (label, value) in enumerate(self._statistics_rows(data), 1):
+            label_cell = ws.cell(row=start_row + idx, column=1, value=label)
+            value_cell = ws.cell(row=start_row + idx, column=2, value=value)
+            
+            if 'STATISTICS' in label or 'DISTRIBUTION' in label:
+                label_cell.font = self._BOLD_FONT
+    
+    def _statistics_rows(self, data: List[Dict]) -> List[Tuple[str, Any]]:
+        """Build the (label, value) rows of the statistics summary"""
+        low = self.config['low_threshold']
+        high = self.config['high_threshold']
+        very_high = self.config['very_high_threshold']
+        
+        if np is not None and len(data) >= _NUMPY_MIN_READINGS:
+            # Large exports: one contiguous array, vectorized comparisons
+            values = np.fromiter((d['glucose'] for d in data), dtype=np.float64, count=len(data))
+            avg_glucose = float(values.mean())
+            min_glucose = float(values.min())
+            max_glucose = float(values.max())
+            
+            low_count = int(np.count_nonzero(values < low))
+            normal_count = int(np.count_nonzero((values >= low) & (values <= high)))
+            high_count = int(np.count_nonzero((values > high) & (values <= very_high)))
+            very_high_count = int(np.count_nonzero(values > very_high))
+        else:
+            # One pass for the totals and the range counts
+            total = 0.0
+            min_glucose = math.inf
+            max_glucose = -math.inf
+            low_count = normal_count = high_count = very_high_count = 0
+            
+            for d in data:
+                v = d['glucose']
+                total += v
+                if v < min_glucose:
+                    min_glucose = v
+                if v > max_glucose:
+                    max_glucose = v
+                
+                if v < low:
+                    low_count += 1
+                elif v <= high:
+                    normal_count += 1
+                elif v <= very_high:
+                    high_count += 1
+                else:
+                    very_high_count += 1
+            
+            avg_glucose = total / len(data)
         
-        # Count readings in different ranges
-        low_count = sum(1 for v in glucose_values if v < self.config['low_threshold'])
-        normal_count = sum(1 for v in glucose_values if self.config['low_threshold'] <= v <= self.config['high_threshold'])
-        high_count = sum(1 for v in glucose_values if self.config['high_threshold'] < v <= self.config['very_high_threshold'])
-        very_high_count = sum(1 for v in glucose_values if v > self.config['very_high_threshold'])
+        return self._format_statistics(
+            data[0]['datetime'], data[-1]['datetime'], len(data),
+            avg_glucose, min_glucose, max_glucose,
+            low_count, normal_count, high_count, very_high_count
+        )
+    
+    def _format_statistics(self, first_dt: datetime, last_dt: datetime, total: int,
+                           avg_glucose: float, min_glucose: float, max_glucose: float,
+                           low_count: int, normal_count: int, high_count: int,
+                           very_high_count: int) -> List[Tuple[str, Any]]:
+        """Format computed statistics as (label, value) rows"""
+        low = self.config['low_threshold']
+        high = self.config['high_threshold']
+        very_high = self.config['very_high_threshold']
         
         # Date range info
-        date_range = f"{data[0]['datetime'].strftime('%d.%m.%Y')} - {data[-1]['datetime'].strftime('%d.%m.%Y')}"
+        date_range = f"{first_dt.strftime('%d.%m.%Y')} - {last_dt.strftime('%d.%m.%Y')}"
         
-        ws.cell(row=start_row, column=1, value='STATISTICS').font = Font(bold=True, size=12)
-        
-        stats = [
+        return [
             ('Date Range:', date_range),
-            ('Total Readings:', len(data)),
+            ('Total Readings:', total),
             ('Average Glucose:', f'{avg_glucose:.1f} mmol/L'),
             ('Minimum Glucose:', f'{min_glucose:.1f} mmol/L'),
             ('Maximum Glucose:', f'{max_glucose:.1f} mmol/L'),
             ('', ''),
             ('RANGE DISTRIBUTION:', ''),
-            (f'Low (< {self.config["low_threshold"]} mmol/L):', f'{low_count} ({low_count/len(data)*100:.1f}%)' if data else '0 (0%)'),
-            (f'Normal ({self.config["low_threshold"]}-{self.config["high_threshold"]} mmol/L):', f'{normal_count} ({normal_count/len(data)*100:.1f}%)' if data else '0 (0%)'),
-            (f'High ({self.config["high_threshold"]}-{self.config["very_high_threshold"]} mmol/L):', f'{high_count} ({high_count/len(data)*100:.1f}%)' if data else '0 (0%)'),
-            (f'Very High (> {self.config["very_high_threshold"]} mmol/L):', f'{very_high_count} ({very_high_count/len(data)*100:.1f}%)' if data else '0 (0%)')
+            (f'Low (< {low} mmol/L):', f'{low_count} ({low_count/total*100:.1f}%)'),
+            (f'Normal ({low}-{high} mmol/L):', f'{normal_count} ({normal_count/total*100:.1f}%)'),
+            (f'High ({high}-{very_high} mmol/L):', f'{high_count} ({high_count/total*100:.1f}%)'),
+            (f'Very High (> {very_high} mmol/L):', f'{very_high_count} ({very_high_count/total*100:.1f}%)')
         ]
-        
-        for idx, (label, value) in enumerate(stats, 1):
-            label_cell = ws.cell(row=start_row + idx, column=1, value=label)
-            value_cell = ws.cell(row=start_row + idx, column=2, value=value)
-            
-            if 'STATISTICS' in label or 'DISTRIBUTION' in label:
-                label_cell.font = Font(bold=True)
     
     def _open_file(self, filepath: str):
         """Open file with cross-platform support"""
@@ -441,8 +1090,15 @@ class EnhancedGlucoseConverter:
                 template_name: Optional[str] = None,
                 start_date: Optional[datetime] = None,
                 end_date: Optional[datetime] = None,
-                incremental: bool = None) -> str:
-        """Enhanced conversion with template and date filtering"""
+                incremental: bool = None,
+                stream: bool = False,
+                fast: bool = False) -> str:
+        """Enhanced conversion with template and date filtering
+        
+        With ``stream`` set and no template in use, the CSV is converted in a
+        single low-memory pass by ``stream_convert``. With ``fast`` set and no
+        template, the XLSX is written directly by ``_write_xlsx_raw``.
+        """
         
         # Validate input file
         if not os.path.exists(csv_path):
@@ -479,34 +1135,51 @@ class EnhancedGlucoseConverter:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = output_dir / f"{base_name}_formatted_{timestamp}.xlsx"
         
-        # Read CSV data with filtering
-        print(f"📖 Reading CSV file: {csv_path}")
-        data = self.read_csv(csv_path, start_date, end_date)
-        
-        if not data:
-            print("⚠️ No data found in the specified date range")
-            return None
-        
-        print(f"✅ Found {len(data)} glucose readings")
-        if start_date or end_date:
-            date_range = []
-            if start_date:
-                date_range.append(f"from {start_date.strftime('%d.%m.%Y')}")
-            if end_date:
-                date_range.append(f"to {end_date.strftime('%d.%m.%Y')}")
-            print(f"📅 Date range: {' '.join(date_range)}")
-        
         # Use template if specified or default
         if not template_name:
             template_name = self.config.get('default_template')
         
-        # Create XLSX file
-        print(f"📝 Creating formatted XLSX file...")
-        self.create_xlsx_with_template(data, str(output_path), template_name)
+        if stream and not template_name:
+            # Single pass: parse and write each row without keeping the data
+            print(f"📝 Streaming CSV file into formatted XLSX: {csv_path}")
+            count, latest_date = self.stream_convert(csv_path, str(output_path), start_date, end_date)
+            
+            if not count:
+                print("⚠️ No data found in the specified date range")
+                return None
+            
+            print(f"✅ Wrote {count} glucose readings")
+        else:
+            # Read CSV data with filtering
+            print(f"📖 Reading CSV file: {csv_path}")
+            data = self.read_csv(csv_path, start_date, end_date)
+            
+            if not data:
+                print("⚠️ No data found in the specified date range")
+                return None
+            
+            print(f"✅ Found {len(data)} glucose readings")
+            if start_date or end_date:
+                date_range = []
+                if start_date:
+                    date_range.append(f"from {start_date.strftime('%d.%m.%Y')}")
+                if end_date:
+                    date_range.append(f"to {end_date.strftime('%d.%m.%Y')}")
+                print(f"📅 Date range: {' '.join(date_range)}")
+            
+            # Create XLSX file
+            print(f"📝 Creating formatted XLSX file...")
+            if fast and not template_name:
+                self._write_xlsx_raw(data, str(output_path))
+                print(f"✅ Successfully created XLSX file: {output_path}")
+                if self.config['auto_open']:
+                    self._open_file(str(output_path))
+            else:
+                self.create_xlsx_with_template(data, str(output_path), template_name)
+            latest_date = max(d['datetime'] for d in data)
         
         # Update export tracker if incremental
-        if incremental and data:
-            latest_date = max(d['datetime'] for d in data)
+        if incremental:
             self.export_tracker.update_export(csv_path, latest_date)
             print(f"📅 Updated export tracker: last export at {latest_date.strftime('%d.%m.%Y %H:%M')}")
         
@@ -515,18 +1188,73 @@ class EnhancedGlucoseConverter:
 
 def find_latest_csv(folder_path: str) -> Optional[str]:
     """Find the most recent Contour CSV file in a folder"""
-    folder = Path(folder_path)
-    csv_files = list(folder.glob('ContourCSVReport*.csv'))
+    latest_path = None
+    latest_mtime = None
     
-    if not csv_files:
+    try:
+        with os.scandir(folder_path) as entries:
+            # Track the newest file in one pass instead of sorting them all
+            for entry in entries:
+                if (entry.name.startswith('ContourCSVReport')
+                        and entry.name.endswith('.csv')
+                        and entry.is_file()):
+                    mtime = entry.stat().st_mtime_ns
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_mtime = mtime
+                        latest_path = entry.path
+    except FileNotFoundError:
         return None
     
-    csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    return str(csv_files[0])
+    return latest_path
+
 
+def _convert_batch_file(csv_path: str, config_file: Optional[str] = None,
+                        **convert_options) -> Tuple[Optional[str], Optional[str]]:
+    """Convert one file of a batch in a worker process
+    
+    Returns the output path, or None and the error message on failure.
+    """
+    try:
+        converter = EnhancedGlucoseConverter(config_file=config_file)
+        return converter.convert(csv_path, **convert_options), None
+    except Exception as e:
+        return None, str(e)
 
+
+def run_batch(folder_path: str, config_file: Optional[str] = None, **convert_options) -> int:
+    """Convert every Contour CSV in a folder, one file per CPU core
+    
+    Returns the number of files that failed.
+    """
+    csv_files = sorted(str(p) for p in Path(folder_path).glob('ContourCSVReport*.csv'))
+    if not csv_files:
+        print(f"❌ No Contour CSV files found in {folder_path}")
+        return 1
+    
+    print(f"🔄 Converting {len(csv_files)} files...")
+    worker = partial(_convert_batch_file, config_file=config_file, **convert_options)
+    failures = 0
+    
+    with ProcessPoolExecutor() as executor:
+        for csv_file, (output_file, error) in zip(csv_files, executor.map(worker, csv_files)):
+            if error:
+                failures += 1
+                print(f"❌ {Path(csv_file).name}: {error}")
+            elif output_file:
+                print(f"✅ {Path(csv_file).name} -> {output_file}")
+            else:
+                print(f"⚠️ {Path(csv_file).name}: no data in the specified date range")
+    
+    return failures
+
+
+@lru_cache(maxsize=1)
 def get_downloads_folder() -> Path:
-    """Get the downloads folder path for the current platform"""
+    """Get the downloads folder path for the current platform
+    
+    The result is cached; call ``get_downloads_folder.cache_clear()`` to
+    look it up again.
+    """
     system = platform.system()
     
     if system == 'Windows':
@@ -554,6 +1282,7 @@ Examples:
   %(prog)s input.csv --incremental          # Only export new data since last export
   %(prog)s input.csv --template my_template # Use custom template
   %(prog)s input.csv --last-days 7          # Export last 7 days only
+  %(prog)s --batch ~/Downloads              # Convert all CSVs in a folder
   %(prog)s --list-templates                 # Show available templates
   %(prog)s --save-template template.xlsx custom_name  # Save new template
         """
@@ -564,6 +1293,12 @@ Examples:
     parser.add_argument('-c', '--config', help='Path to configuration file')
     parser.add_argument('--auto-detect', action='store_true', help='Auto-detect latest CSV')
     parser.add_argument('--create-config', action='store_true', help='Create sample config')
+    parser.add_argument('--stream', action='store_true',
+                       help='Convert in a single low-memory pass (for very large files; ignores templates)')
+    parser.add_argument('--batch', metavar='FOLDER',
+                       help='Convert all Contour CSV files in FOLDER in parallel')
+    parser.add_argument('--fast', action='store_true',
+                       help='Write the XLSX directly without openpyxl (for very large files; ignores templates)')
     
     # Template options
     parser.add_argument('--template', help='Template name to use')
@@ -653,28 +1388,6 @@ date_filter_days = 30
         print(f"✅ Created configuration file: {config_path}")
         return 0
     
-    # Determine input file
-    input_file = args.input
-    
-    if args.auto_detect or not input_file:
-        downloads = get_downloads_folder()
-        print(f"🔍 Looking for latest CSV in {downloads}...")
-        input_file = find_latest_csv(str(downloads))
-        
-        if not input_file:
-            print("❌ No Contour CSV files found in Downloads folder")
-            return 1
-        
-        print(f"✅ Found: {input_file}")
-    
-    # Reset tracker if requested
-    if args.reset_tracker:
-        if input_file in converter.export_tracker.history:
-            del converter.export_tracker.history[input_file]
-            converter.export_tracker.save_history()
-            print(f"✅ Reset export tracker for: {Path(input_file).name}")
-        return 0
-    
     # Parse date filters
     start_date = None
     end_date = None
@@ -697,6 +1410,42 @@ date_filter_days = 30
         end_date = datetime.now()
         start_date = end_date - timedelta(days=args.last_days)
     
+    # Convert a whole folder
+    if args.batch:
+        failures = run_batch(
+            args.batch,
+            config_file=args.config,
+            template_name=args.template,
+            start_date=start_date,
+            end_date=end_date,
+            incremental=args.incremental,
+            stream=args.stream,
+            fast=args.fast
+        )
+        return 1 if failures else 0
+    
+    # Determine input file
+    input_file = args.input
+    
+    if args.auto_detect or not input_file:
+        downloads = get_downloads_folder()
+        print(f"🔍 Looking for latest CSV in {downloads}...")
+        input_file = find_latest_csv(str(downloads))
+        
+        if not input_file:
+            print("❌ No Contour CSV files found in Downloads folder")
+            return 1
+        
+        print(f"✅ Found: {input_file}")
+    
+    # Reset tracker if requested
+    if args.reset_tracker:
+        if input_file in converter.export_tracker.history:
+            del converter.export_tracker.history[input_file]
+            converter.export_tracker.save_history()
+            print(f"✅ Reset export tracker for: {Path(input_file).name}")
+        return 0
+    
     # Run conversion
     try:
         output_file = converter.convert(
@@ -705,7 +1454,9 @@ date_filter_days = 30
             template_name=args.template,
             start_date=start_date,
             end_date=end_date,
-            incremental=args.incremental
+            incremental=args.incremental,
+            stream=args.stream,
+            fast=args.fast
         )
         
         if output_file:
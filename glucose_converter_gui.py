@@ -7,14 +7,61 @@ Purpose: GUI version with drag-and-drop support for easy CSV conversion
 
 import sys
 import os
-from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import queue
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 
-# Import the converter from main script
-from glucose_converter import GlucoseConverter, find_latest_csv
+# Drag and drop needs tkinterdnd2; without it the file dialog is used
+try:
+    from tkinterdnd2 import DND_FILES, TkinterDnD
+    HAS_DND = True
+except ImportError:
+    HAS_DND = False
+
+
+# Progress queue of the conversion worker, set by _init_worker
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    """Keep the GUI's progress queue in the worker process"""
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _warmup():
+    """Import the converter in the worker process ahead of the first conversion"""
+    import glucose_converter
+
+
+def _new_pool(progress_queue) -> ProcessPoolExecutor:
+    """Start the conversion worker and preload the converter in it"""
+    # Spawn gives the same worker start-up on every platform and never forks
+    # the Tk process
+    pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(progress_queue,)
+    )
+    pool.submit(_warmup)
+    return pool
+
+
+def _convert_worker(csv_path: str, config: dict) -> str:
+    """Convert a CSV in the worker process and return the output path"""
+    from glucose_converter import GlucoseConverter
+    
+    converter = GlucoseConverter()
+    converter.config.update(config)
+    
+    # Progress arrives as a percentage; 100 is left for the finished file
+    return converter.convert(csv_path, progress=_progress_queue.put)
 
 
 class GlucoseConverterGUI:
@@ -31,9 +78,19 @@ class GlucoseConverterGUI:
         except:
             pass
         
-        # Initialize converter
-        self.converter = GlucoseConverter()
+        # Settings chosen in the window; the worker applies them on top of the
+        # converter's own config, so openpyxl is never imported here
+        self.config = {}
         self.current_file = None
+        self.current_file_name = None
+        self._downloads_dir = os.path.join(os.path.expanduser("~"), "Downloads")
+        
+        # Conversions run in a separate process so the XLSX write does not
+        # hold the GIL while the UI is redrawing
+        self._progress_queue = multiprocessing.get_context('spawn').Queue()
+        self._progress_job = None
+        self._pool = _new_pool(self._progress_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Setup UI
         self.setup_ui()
@@ -41,9 +98,21 @@ class GlucoseConverterGUI:
         # Enable drag and drop
         self.setup_drag_drop()
         
+        # Spinbox arrows write the variables on every step; apply the
+        # thresholds once the changes stop
+        self._threshold_after_id = None
+        for var in (self.low_threshold_var, self.high_threshold_var, self.very_high_threshold_var):
+            var.trace_add('write', self._on_threshold_change)
+    
     def setup_ui(self):
         """Create the user interface"""
         
+        # Build hidden and show the window once it is fully laid out
+        self.root.withdraw()
+        
+        style = ttk.Style()
+        style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
+        
         # Main container
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -57,7 +126,7 @@ class GlucoseConverterGUI:
         title_label = ttk.Label(
             main_frame, 
             text="Glucose Data Converter", 
-            font=('Arial', 16, 'bold')
+            style='Title.TLabel'
         )
         title_label.grid(row=0, column=0, pady=10)
         
@@ -194,46 +263,45 @@ class GlucoseConverterGUI:
         # Progress bar
         self.progress_bar = ttk.Progressbar(
             main_frame,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=200
         )
         
+        self.root.update_idletasks()
+        self.root.deiconify()
+        
     def setup_drag_drop(self):
-        """Setup drag and drop functionality"""
-        # Note: Full drag-drop requires tkinterdnd2, but we'll use file dialog as fallback
-        try:
-            # Try to import tkinterdnd2 for drag-drop support
-            from tkinterdnd2 import DND_FILES, TkinterDnD
-            
-            # Recreate root with DnD support
-            self.root.destroy()
-            self.root = TkinterDnD.Tk()
-            self.__init__(self.root)
+        """Setup drag and drop functionality
+        
+        The root must already be a ``TkinterDnD.Tk`` (see ``main``); without
+        tkinterdnd2 the file dialog is the only way to pick a file.
+        """
+        if HAS_DND:
+            self._splitlist = self.root.tk.splitlist
             
             # Register drop target
             self.drop_frame.drop_target_register(DND_FILES)
             self.drop_frame.dnd_bind('<<Drop>>', self.drop_file)
-            
-        except ImportError:
-            # tkinterdnd2 not available, use file dialog only
-            pass
     
     def drop_file(self, event):
         """Handle dropped file"""
-        files = self.root.tk.splitlist(event.data)
-        if files:
-            file_path = files[0]
-            if file_path.lower().endswith('.csv'):
-                self.load_file(file_path)
-            else:
-                messagebox.showerror("Error", "Please drop a CSV file")
+        files = self._splitlist(event.data)
+        if not files:
+            return
+        
+        file_path = files[0]
+        if file_path[-4:].lower() != '.csv':
+            messagebox.showerror("Error", "Please drop a CSV file")
+            return
+        self.load_file(file_path)
     
     def browse_file(self):
         """Open file browser to select CSV"""
         file_path = filedialog.askopenfilename(
             title="Select Contour CSV File",
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
-            initialdir=str(Path.home() / "Downloads")
+            initialdir=self._downloads_dir
         )
         
         if file_path:
@@ -241,14 +309,16 @@ class GlucoseConverterGUI:
     
     def load_file(self, file_path):
         """Load selected CSV file"""
+        name = os.path.basename(file_path)
         self.current_file = file_path
-        self.file_label.config(text=Path(file_path).name, foreground="black")
+        self.current_file_name = name
+        self.file_label.config(text=name, foreground="black")
         self.convert_btn.config(state="normal")
-        self.update_status(f"Loaded: {Path(file_path).name}")
+        self.update_status(f"Loaded: {name}")
         
         # Update drop zone appearance
         self.drop_label.config(
-            text=f"✅ {Path(file_path).name}\n\nDrop another file to replace",
+            text=f"✅ {name}\n\nDrop another file to replace",
             bg='#e6ffe6'
         )
     
@@ -257,22 +327,51 @@ class GlucoseConverterGUI:
         folder = filedialog.askdirectory(title="Select Output Folder")
         if folder:
             self.output_var.set(folder)
-            self.converter.config['output_folder'] = folder
+            self.config['output_folder'] = folder
     
     def auto_detect_csv(self):
         """Auto-detect latest CSV in Downloads"""
         self.update_status("Searching for latest CSV...")
         
-        downloads = Path.home() / "Downloads"
-        latest_csv = find_latest_csv(str(downloads))
+        # Scan in the background; Downloads may be on a slow network drive
+        threading.Thread(target=self._find_latest_csv, daemon=True).start()
+    
+    def _find_latest_csv(self):
+        """Look for the latest CSV and hand the result to the UI thread"""
+        from glucose_converter import find_latest_csv
         
+        latest_csv = find_latest_csv(self._downloads_dir)
+        self.root.after(0, self._csv_detected, latest_csv)
+    
+    def _csv_detected(self, latest_csv):
+        """Load the auto-detected CSV, or report that none was found"""
         if latest_csv:
             self.load_file(latest_csv)
-            messagebox.showinfo("Success", f"Found: {Path(latest_csv).name}")
+            messagebox.showinfo("Success", f"Found: {self.current_file_name}")
         else:
             messagebox.showwarning("Not Found", "No Contour CSV files found in Downloads folder")
             self.update_status("No CSV files found")
     
+    def _on_threshold_change(self, *_):
+        """Debounce threshold edits into a single config update"""
+        if self._threshold_after_id:
+            self.root.after_cancel(self._threshold_after_id)
+        self._threshold_after_id = self.root.after(150, self._apply_thresholds)
+    
+    def _apply_thresholds(self):
+        """Write the threshold spinbox values into the conversion settings"""
+        self._threshold_after_id = None
+        try:
+            thresholds = {
+                'low_threshold': self.low_threshold_var.get(),
+                'high_threshold': self.high_threshold_var.get(),
+                'very_high_threshold': self.very_high_threshold_var.get()
+            }
+        except tk.TclError:
+            # A value is still being typed; convert_file reads it again
+            return
+        self.config.update(thresholds)
+    
     def convert_file(self):
         """Convert the loaded CSV file"""
         if not self.current_file:
@@ -280,42 +379,70 @@ class GlucoseConverterGUI:
             return
         
         # Update converter settings
-        self.converter.config['low_threshold'] = self.low_threshold_var.get()
-        self.converter.config['high_threshold'] = self.high_threshold_var.get()
-        self.converter.config['very_high_threshold'] = self.very_high_threshold_var.get()
-        self.converter.config['auto_open'] = self.auto_open_var.get()
+        self.config.update(
+            low_threshold=self.low_threshold_var.get(),
+            high_threshold=self.high_threshold_var.get(),
+            very_high_threshold=self.very_high_threshold_var.get(),
+            auto_open=self.auto_open_var.get()
+        )
         
         # Disable button during conversion
         self.convert_btn.config(state="disabled")
         
         # Show progress
+        self._drain_progress()
+        self.progress_bar['value'] = 0
         self.progress_bar.grid(row=6, column=0, pady=10)
-        self.progress_bar.start(10)
         self.update_status("Converting...")
+        self._progress_job = self.root.after(200, self._poll_progress)
         
-        # Run conversion in thread to avoid freezing UI
-        thread = threading.Thread(target=self.run_conversion)
-        thread.start()
+        # Run conversion in the worker process to avoid freezing UI
+        future = self._pool.submit(_convert_worker, self.current_file, dict(self.config))
+        future.add_done_callback(lambda f: self.root.after(0, self._on_done, f))
     
-    def run_conversion(self):
-        """Run the conversion process"""
-        try:
-            output_file = self.converter.convert(self.current_file)
-            
-            # Update UI in main thread
-            self.root.after(0, self.conversion_success, output_file)
-            
-        except Exception as e:
-            # Update UI in main thread
-            self.root.after(0, self.conversion_error, str(e))
+    def _drain_progress(self):
+        """Return the latest progress sent by the worker, if any"""
+        value = None
+        while not self._progress_queue.empty():
+            try:
+                value = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        return value
+    
+    def _poll_progress(self):
+        """Move the progress bar to the worker's latest reported progress"""
+        value = self._drain_progress()
+        if value is not None:
+            self.progress_bar['value'] = value
+        self._progress_job = self.root.after(200, self._poll_progress)
+    
+    def _stop_progress(self):
+        """Stop polling the worker for progress and hide the progress bar"""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+        self.progress_bar.grid_remove()
+    
+    def _on_done(self, future):
+        """Dispatch a finished conversion to the UI handlers"""
+        error = future.exception()
+        if error is None:
+            self.conversion_success(future.result())
+            return
+        
+        # A crashed worker leaves the pool unusable; start a fresh one
+        if isinstance(error, BrokenProcessPool):
+            self._pool = _new_pool(self._progress_queue)
+        self.conversion_error(str(error))
     
     def conversion_success(self, output_file):
         """Handle successful conversion"""
-        self.progress_bar.stop()
-        self.progress_bar.grid_remove()
+        self.progress_bar['value'] = 100
+        self._stop_progress()
         self.convert_btn.config(state="normal")
         
-        self.update_status(f"Success! Saved to: {Path(output_file).name}")
+        self.update_status(f"Success! Saved to: {os.path.basename(output_file)}")
         
         messagebox.showinfo(
             "Success", 
@@ -324,8 +451,7 @@ class GlucoseConverterGUI:
     
     def conversion_error(self, error_msg):
         """Handle conversion error"""
-        self.progress_bar.stop()
-        self.progress_bar.grid_remove()
+        self._stop_progress()
         self.convert_btn.config(state="normal")
         
         self.update_status("Conversion failed")
@@ -334,16 +460,20 @@ class GlucoseConverterGUI:
     def update_status(self, message):
         """Update status bar"""
         self.status_label.config(text=message)
+    
+    def on_close(self):
+        """Stop the worker process and close the window"""
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
 
 
 def main():
     """Main entry point for GUI application"""
     
-    # Check if tkinterdnd2 is available for better drag-drop
-    try:
-        from tkinterdnd2 import TkinterDnD
+    # Use a drag-and-drop capable root when tkinterdnd2 is available
+    if HAS_DND:
         root = TkinterDnD.Tk()
-    except ImportError:
+    else:
         # Fall back to standard tkinter
         root = tk.Tk()
         print("Note: Install tkinterdnd2 for drag-and-drop support:")
@@ -363,4 +493,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Needed for the worker process in a frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -7,11 +7,12 @@ Purpose: GUI with advanced features for glucose data conversion
 
 import sys
 import os
-from pathlib import Path
+import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from tkinter import font as tkfont
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional
 import platform
@@ -24,6 +25,19 @@ from glucose_converter_enhanced import (
     TemplateManager
 )
 
+# Date filter entries, "DD.MM.YYYY"
+_DATE_ENTRY_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{4})$')
+
+
+@lru_cache(maxsize=256)
+def _parse_date_entry(text: str) -> datetime:
+    """Parse a DD.MM.YYYY date filter entry; raises ValueError if invalid"""
+    match = _DATE_ENTRY_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid date: {text!r}")
+    day, month, year = match.groups()
+    return datetime(int(year), int(month), int(day))
+
 
 class EnhancedGlucoseGUI:
     """Enhanced GUI with template and date filtering support"""
@@ -37,6 +51,18 @@ class EnhancedGlucoseGUI:
         self.converter = EnhancedGlucoseConverter()
         self.template_manager = self.converter.template_manager
         self.current_file = None
+        self._downloads_dir = str(get_downloads_folder())
+        
+        # Key of the history currently shown; refresh_history skips the
+        # rebuild while it is unchanged
+        self._history_key = None
+        
+        # Template names with the manager version they were listed at
+        self._templates_cache = (None, [])
+        
+        # One worker thread, kept for the life of the window, runs conversions
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="convert")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Setup UI
         self.setup_ui()
@@ -47,29 +73,44 @@ class EnhancedGlucoseGUI:
     def setup_ui(self):
         """Create the enhanced user interface"""
         
+        # Build hidden so the tabs are laid out once, then show the window
+        self.root.withdraw()
+        
+        # Settings are read by conversions even if the Settings tab was
+        # never opened, so their variables exist from the start
+        self.low_threshold_var = tk.DoubleVar(value=self.converter.config['low_threshold'])
+        self.high_threshold_var = tk.DoubleVar(value=self.converter.config['high_threshold'])
+        self.very_high_threshold_var = tk.DoubleVar(value=self.converter.config['very_high_threshold'])
+        self.output_var = tk.StringVar(value=self.converter.config.get('output_folder', 'Same as input'))
+        self.auto_open_var = tk.BooleanVar(value=self.converter.config.get('auto_open', False))
+        self.silent_success_var = tk.BooleanVar(value=False)
+        self.history_text = None
+        
         # Create notebook for tabs
-        notebook = ttk.Notebook(self.root)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Main conversion tab
-        self.main_tab = ttk.Frame(notebook)
-        notebook.add(self.main_tab, text="Convert")
+        self.main_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.main_tab, text="Convert")
         self.setup_main_tab()
         
-        # Templates tab
-        self.template_tab = ttk.Frame(notebook)
-        notebook.add(self.template_tab, text="Templates")
-        self.setup_template_tab()
+        # The other tabs are built the first time they are selected
+        self.template_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.template_tab, text="Templates")
+        
+        self.settings_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.settings_tab, text="Settings")
         
-        # Settings tab
-        self.settings_tab = ttk.Frame(notebook)
-        notebook.add(self.settings_tab, text="Settings")
-        self.setup_settings_tab()
+        self.history_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.history_tab, text="Export History")
         
-        # Export History tab
-        self.history_tab = ttk.Frame(notebook)
-        notebook.add(self.history_tab, text="Export History")
-        self.setup_history_tab()
+        self._tab_builders = {
+            str(self.template_tab): self.setup_template_tab,
+            str(self.settings_tab): self.setup_settings_tab,
+            str(self.history_tab): self.setup_history_tab
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
         
         # Status bar at bottom
         self.status_frame = ttk.Frame(self.root)
@@ -84,6 +125,15 @@ class EnhancedGlucoseGUI:
             mode='indeterminate',
             length=200
         )
+        
+        self.root.update_idletasks()
+        self.root.deiconify()
+    
+    def _on_tab_change(self, event):
+        """Build a tab the first time it is selected"""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
     
     def setup_main_tab(self):
         """Setup the main conversion tab"""
@@ -124,29 +174,14 @@ class EnhancedGlucoseGUI:
         date_frame = ttk.LabelFrame(main_frame, text="Date Filter", padding="10")
         date_frame.pack(fill=tk.X, pady=10)
         
-        # Filter mode selection
+        # Filter mode selection, one radio button per row
         self.filter_mode = tk.StringVar(value="all")
-        
-        ttk.Radiobutton(
-            date_frame, 
-            text="All data", 
-            variable=self.filter_mode, 
-            value="all"
-        ).grid(row=0, column=0, sticky=tk.W)
-        
-        ttk.Radiobutton(
-            date_frame, 
-            text="Incremental (since last export)", 
-            variable=self.filter_mode, 
-            value="incremental"
-        ).grid(row=1, column=0, sticky=tk.W)
-        
-        ttk.Radiobutton(
-            date_frame, 
-            text="Last N days:", 
-            variable=self.filter_mode, 
-            value="days"
-        ).grid(row=2, column=0, sticky=tk.W)
+        self._make_radios(date_frame, self.filter_mode, [
+            ("All data", "all"),
+            ("Incremental (since last export)", "incremental"),
+            ("Last N days:", "days"),
+            ("Custom range", "custom")
+        ])
         
         self.days_var = tk.IntVar(value=30)
         days_spin = ttk.Spinbox(
@@ -158,13 +193,6 @@ class EnhancedGlucoseGUI:
         )
         days_spin.grid(row=2, column=1, sticky=tk.W, padx=5)
         
-        ttk.Radiobutton(
-            date_frame, 
-            text="Custom range", 
-            variable=self.filter_mode, 
-            value="custom"
-        ).grid(row=3, column=0, sticky=tk.W)
-        
         # Custom date range
         custom_frame = ttk.Frame(date_frame)
         custom_frame.grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=20)
@@ -210,6 +238,15 @@ class EnhancedGlucoseGUI:
             command=self.auto_detect_csv
         ).pack(side=tk.LEFT, padx=5)
     
+    def _make_radios(self, parent, variable, options):
+        """Create radio buttons for ``(text, value)`` options and grid them in column 0"""
+        radios = [
+            ttk.Radiobutton(parent, text=text, variable=variable, value=value)
+            for text, value in options
+        ]
+        for row, radio in enumerate(radios):
+            radio.grid(row=row, column=0, sticky=tk.W)
+    
     def setup_template_tab(self):
         """Setup the templates management tab"""
         template_frame = ttk.Frame(self.template_tab, padding="20")
@@ -254,7 +291,7 @@ class EnhancedGlucoseGUI:
         ttk.Button(
             action_frame,
             text="Refresh List",
-            command=self.refresh_template_list
+            command=lambda: self.refresh_template_list(reload=True)
         ).pack(side=tk.LEFT, padx=5)
         
         # Template info
@@ -277,7 +314,6 @@ class EnhancedGlucoseGUI:
         threshold_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(threshold_frame, text="Low (<):").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.low_threshold_var = tk.DoubleVar(value=self.converter.config['low_threshold'])
         ttk.Spinbox(
             threshold_frame, 
             from_=1.0, 
@@ -288,7 +324,6 @@ class EnhancedGlucoseGUI:
         ).grid(row=0, column=1, pady=5)
         
         ttk.Label(threshold_frame, text="High (>):").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.high_threshold_var = tk.DoubleVar(value=self.converter.config['high_threshold'])
         ttk.Spinbox(
             threshold_frame, 
             from_=8.0, 
@@ -299,7 +334,6 @@ class EnhancedGlucoseGUI:
         ).grid(row=1, column=1, pady=5)
         
         ttk.Label(threshold_frame, text="Very High (>):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.very_high_threshold_var = tk.DoubleVar(value=self.converter.config['very_high_threshold'])
         ttk.Spinbox(
             threshold_frame, 
             from_=15.0, 
@@ -318,7 +352,6 @@ class EnhancedGlucoseGUI:
         folder_frame = ttk.Frame(output_frame)
         folder_frame.pack(fill=tk.X, pady=5)
         
-        self.output_var = tk.StringVar(value=self.converter.config.get('output_folder', 'Same as input'))
         self.output_entry = ttk.Entry(folder_frame, textvariable=self.output_var, state="readonly")
         self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -328,13 +361,18 @@ class EnhancedGlucoseGUI:
             command=self.select_output_folder
         ).pack(side=tk.RIGHT, padx=(5, 0))
         
-        self.auto_open_var = tk.BooleanVar(value=self.converter.config.get('auto_open', False))
         ttk.Checkbutton(
             output_frame,
             text="Open file after conversion",
             variable=self.auto_open_var
         ).pack(anchor=tk.W, pady=5)
         
+        ttk.Checkbutton(
+            output_frame,
+            text="Only show success in the status bar",
+            variable=self.silent_success_var
+        ).pack(anchor=tk.W, pady=5)
+        
         # Save settings button
         ttk.Button(
             settings_frame,
@@ -402,7 +440,7 @@ class EnhancedGlucoseGUI:
         file_path = filedialog.askopenfilename(
             title="Select Contour CSV File",
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
-            initialdir=str(get_downloads_folder())
+            initialdir=self._downloads_dir
         )
         
         if file_path:
@@ -410,13 +448,14 @@ class EnhancedGlucoseGUI:
     
     def load_file(self, file_path):
         """Load selected CSV file"""
+        name = os.path.basename(file_path)
         self.current_file = file_path
-        self.file_label.config(text=Path(file_path).name, foreground="black")
+        self.file_label.config(text=name, foreground="black")
         self.convert_btn.config(state="normal")
-        self.update_status(f"Loaded: {Path(file_path).name}")
+        self.update_status(f"Loaded: {name}")
         
         self.drop_label.config(
-            text=f"✅ {Path(file_path).name}\n\nDrop another file to replace",
+            text=f"✅ {name}\n\nDrop another file to replace",
             bg='#e6ffe6'
         )
         
@@ -429,12 +468,11 @@ class EnhancedGlucoseGUI:
         """Auto-detect latest CSV"""
         self.update_status("Searching for latest CSV...")
         
-        downloads = get_downloads_folder()
-        latest_csv = find_latest_csv(str(downloads))
+        latest_csv = find_latest_csv(self._downloads_dir)
         
         if latest_csv:
             self.load_file(latest_csv)
-            messagebox.showinfo("Success", f"Found: {Path(latest_csv).name}")
+            messagebox.showinfo("Success", f"Found: {os.path.basename(latest_csv)}")
         else:
             messagebox.showwarning("Not Found", "No Contour CSV files found")
     
@@ -459,8 +497,8 @@ class EnhancedGlucoseGUI:
             start_date = end_date - timedelta(days=days)
         elif filter_mode == "custom":
             try:
-                start_date = datetime.strptime(self.start_date_var.get(), '%d.%m.%Y')
-                end_date = datetime.strptime(self.end_date_var.get(), '%d.%m.%Y')
+                start_date = _parse_date_entry(self.start_date_var.get())
+                end_date = _parse_date_entry(self.end_date_var.get())
             except ValueError:
                 messagebox.showerror("Error", "Invalid date format. Use DD.MM.YYYY")
                 return
@@ -471,10 +509,7 @@ class EnhancedGlucoseGUI:
             template_name = self.template_var.get()
         
         # Update converter settings
-        self.converter.config['low_threshold'] = self.low_threshold_var.get()
-        self.converter.config['high_threshold'] = self.high_threshold_var.get()
-        self.converter.config['very_high_threshold'] = self.very_high_threshold_var.get()
-        self.converter.config['auto_open'] = self.auto_open_var.get()
+        self._apply_settings()
         
         # Disable button and show progress
         self.convert_btn.config(state="disabled")
@@ -482,31 +517,27 @@ class EnhancedGlucoseGUI:
         self.progress_bar.start(10)
         self.update_status("Converting...")
         
-        # Run in thread
-        thread = threading.Thread(
-            target=self.run_conversion,
-            args=(start_date, end_date, incremental, template_name)
+        # Run in the worker thread; it gets the file path up front so loading
+        # another file meanwhile does not change what is converted
+        future = self._pool.submit(
+            self.converter.convert,
+            self.current_file,
+            template_name=template_name,
+            start_date=start_date,
+            end_date=end_date,
+            incremental=incremental
         )
-        thread.start()
+        future.add_done_callback(lambda f: self.root.after(0, self._on_convert_done, f))
     
-    def run_conversion(self, start_date, end_date, incremental, template_name):
-        """Run the conversion process"""
-        try:
-            output_file = self.converter.convert(
-                self.current_file,
-                template_name=template_name,
-                start_date=start_date,
-                end_date=end_date,
-                incremental=incremental
-            )
-            
-            if output_file:
-                self.root.after(0, self.conversion_success, output_file)
-            else:
-                self.root.after(0, self.conversion_error, "No data in specified range")
-            
-        except Exception as e:
-            self.root.after(0, self.conversion_error, str(e))
+    def _on_convert_done(self, future):
+        """Dispatch a finished conversion to the UI handlers"""
+        error = future.exception()
+        if error is not None:
+            self.conversion_error(str(error))
+        elif future.result():
+            self.conversion_success(future.result())
+        else:
+            self.conversion_error("No data in specified range")
     
     def conversion_success(self, output_file):
         """Handle successful conversion"""
@@ -514,13 +545,38 @@ class EnhancedGlucoseGUI:
         self.progress_bar.pack_forget()
         self.convert_btn.config(state="normal")
         
-        self.update_status(f"Success! Saved to: {Path(output_file).name}")
+        message = f"Success! Saved to: {os.path.basename(output_file)}"
+        self.update_status(message)
         self.refresh_history()
         
-        messagebox.showinfo(
-            "Success",
-            f"Conversion complete!\n\nFile saved to:\n{output_file}"
-        )
+        # Neither notice waits for the user, so conversions can follow each
+        # other without dismissing a dialog; auto_open is handled by the
+        # converter itself
+        if self.silent_success_var.get():
+            self.root.after(3000, self._clear_status, message)
+        else:
+            self._show_toast(f"Conversion complete!\n\nFile saved to:\n{output_file}")
+    
+    def _show_toast(self, message, duration=2000):
+        """Show a small window over the main one that closes by itself"""
+        toast = tk.Toplevel(self.root)
+        toast.title("Success")
+        toast.transient(self.root)
+        toast.resizable(False, False)
+        ttk.Label(toast, text=message, padding=15, justify=tk.LEFT).pack()
+        
+        # Center over the main window
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - toast.winfo_width()) // 2
+        y = self.root.winfo_rooty() + (self.root.winfo_height() - toast.winfo_height()) // 2
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(duration, toast.destroy)
+    
+    def _clear_status(self, message):
+        """Reset the status bar unless it has changed since showing ``message``"""
+        if self.status_label.cget('text') == message:
+            self.update_status("Ready")
     
     def conversion_error(self, error_msg):
         """Handle conversion error"""
@@ -531,24 +587,39 @@ class EnhancedGlucoseGUI:
         self.update_status("Conversion failed")
         messagebox.showerror("Error", f"Conversion failed:\n{error_msg}")
     
+    def list_templates(self, reload=False):
+        """Return the template names, listing the folder only after changes"""
+        version, templates = self._templates_cache
+        if reload or version != self.template_manager.version:
+            templates = self.template_manager.list_templates()
+            self._templates_cache = (self.template_manager.version, templates)
+        return templates
+    
     def refresh_templates(self):
         """Refresh template dropdown"""
-        templates = ['<default>'] + self.template_manager.list_templates()
+        templates = ['<default>'] + self.list_templates()
         self.template_combo['values'] = templates
         
-        if self.converter.config.get('default_template') in templates:
-            self.template_var.set(self.converter.config['default_template'])
+        default = self.converter.config.get('default_template')
+        if default in templates:
+            self.template_var.set(default)
     
-    def refresh_template_list(self):
-        """Refresh template listbox"""
+    def refresh_template_list(self, reload=False):
+        """Refresh template listbox
+        
+        ``reload`` lists the template folder again even if no template was
+        saved or deleted here, e.g. after files were copied in by hand.
+        """
         self.template_listbox.delete(0, tk.END)
         
-        templates = self.template_manager.list_templates()
-        for template in templates:
-            display_name = template
-            if template == self.converter.config.get('default_template'):
-                display_name += " (default)"
-            self.template_listbox.insert(tk.END, display_name)
+        # Insert every entry in a single Tk call
+        default = self.converter.config.get('default_template')
+        items = [
+            template + (" (default)" if template == default else "")
+            for template in self.list_templates(reload)
+        ]
+        if items:
+            self.template_listbox.insert(tk.END, *items)
         
         self.refresh_templates()
     
@@ -576,9 +647,7 @@ class EnhancedGlucoseGUI:
         template_name = self.template_listbox.get(selection[0]).replace(" (default)", "")
         
         if messagebox.askyesno("Confirm", f"Delete template '{template_name}'?"):
-            template_path = self.template_manager.get_template_path(template_name)
-            if template_path:
-                template_path.unlink()
+            if self.template_manager.delete_template(template_name):
                 self.refresh_template_list()
                 messagebox.showinfo("Success", f"Template '{template_name}' deleted")
     
@@ -601,32 +670,62 @@ class EnhancedGlucoseGUI:
             self.output_var.set(folder)
             self.converter.config['output_folder'] = folder
     
+    def _pending_config(self):
+        """Settings as currently entered in the Settings tab"""
+        return {
+            'low_threshold': self.low_threshold_var.get(),
+            'high_threshold': self.high_threshold_var.get(),
+            'very_high_threshold': self.very_high_threshold_var.get(),
+            'auto_open': self.auto_open_var.get()
+        }
+    
+    def _apply_settings(self):
+        """Copy changed settings into the converter config in one update"""
+        config = self.converter.config
+        delta = {key: value for key, value in self._pending_config().items() if config.get(key) != value}
+        if delta:
+            config.update(delta)
+    
     def save_settings(self):
         """Save current settings"""
-        self.converter.config['low_threshold'] = self.low_threshold_var.get()
-        self.converter.config['high_threshold'] = self.high_threshold_var.get()
-        self.converter.config['very_high_threshold'] = self.very_high_threshold_var.get()
-        self.converter.config['auto_open'] = self.auto_open_var.get()
+        self._apply_settings()
         
         messagebox.showinfo("Success", "Settings saved")
         self.update_status("Settings saved")
     
     def refresh_history(self):
         """Refresh export history display"""
-        self.history_text.delete(1.0, tk.END)
+        # Nothing to refresh until the history tab has been opened
+        if self.history_text is None:
+            return
+        
+        tracker = self.converter.export_tracker
+        history = tracker.history
+        
+        # The tracker replaces the history dict and rewrites its file on
+        # every change, so both identify the version on display
+        try:
+            mtime = os.stat(tracker.tracker_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (id(history), len(history), mtime)
+        if key == self._history_key:
+            return
+        self._history_key = key
         
-        history = self.converter.export_tracker.history
         if history:
-            for file_path, info in history.items():
-                file_name = Path(file_path).name
-                last_export = info['last_export']
-                updated = info['updated_at']
-                
-                self.history_text.insert(tk.END, f"File: {file_name}\n")
-                self.history_text.insert(tk.END, f"  Last Export: {last_export}\n")
-                self.history_text.insert(tk.END, f"  Updated: {updated}\n\n")
+            text = "".join(
+                f"File: {os.path.basename(file_path)}\n"
+                f"  Last Export: {info['last_export']}\n"
+                f"  Updated: {info['updated_at']}\n\n"
+                for file_path, info in history.items()
+            )
         else:
-            self.history_text.insert(tk.END, "No export history available")
+            text = "No export history available"
+        
+        # Replace the contents with a single insert
+        self.history_text.delete(1.0, tk.END)
+        self.history_text.insert(tk.END, text)
     
     def clear_history(self):
         """Clear export history"""
@@ -639,6 +738,11 @@ class EnhancedGlucoseGUI:
     def update_status(self, message):
         """Update status bar"""
         self.status_label.config(text=message)
+    
+    def on_close(self):
+        """Stop the conversion worker and close the window"""
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
 
 
 def main():
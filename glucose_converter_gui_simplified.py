@@ -7,20 +7,31 @@ Purpose: Clean GUI for glucose data conversion
 
 import sys
 import os
-from pathlib import Path
+import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import queue
 import threading
 from datetime import datetime, timedelta
 from typing import Optional
 import platform
 
-# Import simplified converter
-from glucose_converter_simplified import (
-    SimplifiedGlucoseConverter, 
-    find_latest_csv,
-    get_downloads_folder
-)
+# Initial window size; main() centers the window from it without waiting
+# for a layout pass
+_WINDOW_WIDTH = 650
+_WINDOW_HEIGHT = 600
+
+# Text a date entry may hold while it is being typed
+_DATE_INPUT_RE = re.compile(r'^[0-9.]{0,10}$')
+
+
+def _parse_ddmmyyyy(text: str) -> datetime:
+    """Parse a DD.MM.YYYY date; raises ValueError if it has another shape"""
+    day, month, year = text.split('.')
+    if not (day.isdigit() and month.isdigit() and year.isdigit()) \
+            or len(day) > 2 or len(month) > 2 or len(year) != 4:
+        raise ValueError(f"Invalid date: {text!r}")
+    return datetime(int(year), int(month), int(day))
 
 
 class SimplifiedGlucoseGUI:
@@ -29,21 +40,65 @@ class SimplifiedGlucoseGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Glucose Data Converter")
-        self.root.geometry("650x600")
+        self.root.geometry(f"{_WINDOW_WIDTH}x{_WINDOW_HEIGHT}")
         
-        # Initialize converter
-        self.converter = SimplifiedGlucoseConverter()
+        # The converter (and openpyxl with it) is loaded on first use so the
+        # window can appear without waiting for the import
+        self.converter = None
         self.current_file = None
         
+        # A single worker thread takes conversion jobs from job_q and puts
+        # (status, payload) results on result_q for the Tk loop to pick up
+        self.job_q = queue.Queue()
+        self.result_q = queue.Queue()
+        self._pending_jobs = 0
+        threading.Thread(target=self._worker, daemon=True).start()
+        
+        # Last enabled state applied to the custom date and days inputs
+        self._ui_state = {'custom': None, 'days': None}
+        self._downloads_cache = None
+        
+        # Status text waiting to be shown, and the scheduled flush
+        self._pending_status = None
+        self._status_after_id = None
+        
+        # Date entries reject keystrokes that cannot lead to a date
+        self._date_vcmd = (self.root.register(self._validate_date_char), '%P')
+        
         # Setup UI
         self.setup_ui()
         
         # Enable drag and drop (if tkinterdnd2 available)
         self.setup_drag_drop()
         
+    def _ensure_converter(self):
+        """Create the converter on first use and return it"""
+        if self.converter is None:
+            from glucose_converter_simplified import SimplifiedGlucoseConverter
+            self.converter = SimplifiedGlucoseConverter()
+        return self.converter
+    
+    def _downloads(self):
+        """Downloads folder, looked up on first use"""
+        if self._downloads_cache is None:
+            from glucose_converter_simplified import get_downloads_folder
+            self._downloads_cache = str(get_downloads_folder())
+        return self._downloads_cache
+    
+    def _config_var_changed(self, key):
+        """Record the latest valid value of a settings variable"""
+        try:
+            self._settings[key] = self._config_vars[key].get()
+        except tk.TclError:
+            # A value is still being typed; keep the last valid one
+            pass
+    
     def setup_ui(self):
         """Create the simplified user interface"""
         
+        style = ttk.Style(self.root)
+        style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
+        
         # Main container
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -52,7 +107,7 @@ class SimplifiedGlucoseGUI:
         title_label = ttk.Label(
             main_frame, 
             text="Glucose Data Converter", 
-            font=('Arial', 16, 'bold')
+            style='Title.TLabel'
         )
         title_label.pack(pady=10)
         
@@ -150,12 +205,18 @@ class SimplifiedGlucoseGUI:
         
         ttk.Label(self.custom_frame, text="From:").grid(row=0, column=0)
         self.start_date_var = tk.StringVar(value=(datetime.now() - timedelta(days=30)).strftime('%d.%m.%Y'))
-        self.start_date_entry = ttk.Entry(self.custom_frame, textvariable=self.start_date_var, width=12)
+        self.start_date_entry = ttk.Entry(
+            self.custom_frame, textvariable=self.start_date_var, width=12,
+            validate='key', validatecommand=self._date_vcmd
+        )
         self.start_date_entry.grid(row=0, column=1, padx=5)
         
         ttk.Label(self.custom_frame, text="To:").grid(row=0, column=2, padx=(10, 0))
         self.end_date_var = tk.StringVar(value=datetime.now().strftime('%d.%m.%Y'))
-        self.end_date_entry = ttk.Entry(self.custom_frame, textvariable=self.end_date_var, width=12)
+        self.end_date_entry = ttk.Entry(
+            self.custom_frame, textvariable=self.end_date_var, width=12,
+            validate='key', validatecommand=self._date_vcmd
+        )
         self.end_date_entry.grid(row=0, column=3, padx=5)
         
         # Settings
@@ -168,38 +229,23 @@ class SimplifiedGlucoseGUI:
         
         ttk.Label(threshold_frame, text="Thresholds (mmol/L):").pack(side=tk.LEFT)
         
-        ttk.Label(threshold_frame, text="Low <").pack(side=tk.LEFT, padx=(10, 2))
-        self.low_threshold_var = tk.DoubleVar(value=4.0)
-        ttk.Spinbox(
-            threshold_frame, 
-            from_=1.0, 
-            to=10.0, 
-            increment=0.1,
-            textvariable=self.low_threshold_var,
-            width=5
-        ).pack(side=tk.LEFT)
-        
-        ttk.Label(threshold_frame, text="  High >").pack(side=tk.LEFT, padx=(10, 2))
-        self.high_threshold_var = tk.DoubleVar(value=11.9)
-        ttk.Spinbox(
-            threshold_frame, 
-            from_=8.0, 
-            to=20.0, 
-            increment=0.1,
-            textvariable=self.high_threshold_var,
-            width=5
-        ).pack(side=tk.LEFT)
-        
-        ttk.Label(threshold_frame, text="  Very High >").pack(side=tk.LEFT, padx=(10, 2))
-        self.very_high_threshold_var = tk.DoubleVar(value=17.9)
-        ttk.Spinbox(
-            threshold_frame, 
-            from_=15.0, 
-            to=30.0, 
-            increment=0.1,
-            textvariable=self.very_high_threshold_var,
-            width=5
-        ).pack(side=tk.LEFT)
+        # One label and spinbox per threshold: (key, label, default, min, max)
+        self.threshold_vars = {}
+        for key, label, default, low, high in (
+            ('low', "Low <", 4.0, 1.0, 10.0),
+            ('high', "  High >", 11.9, 8.0, 20.0),
+            ('very_high', "  Very High >", 17.9, 15.0, 30.0)
+        ):
+            ttk.Label(threshold_frame, text=label).pack(side=tk.LEFT, padx=(10, 2))
+            var = self.threshold_vars[key] = tk.DoubleVar(value=default)
+            ttk.Spinbox(
+                threshold_frame, 
+                from_=low, 
+                to=high, 
+                increment=0.1,
+                textvariable=var,
+                width=5
+            ).pack(side=tk.LEFT)
         
         # Auto-open checkbox
         self.auto_open_var = tk.BooleanVar(value=True)
@@ -209,6 +255,14 @@ class SimplifiedGlucoseGUI:
             variable=self.auto_open_var
         ).pack(anchor=tk.W, pady=5)
         
+        # Settings are recorded as they are edited and handed to the
+        # converter with each job, never while a conversion is running
+        self._config_vars = {f'{key}_threshold': var for key, var in self.threshold_vars.items()}
+        self._config_vars['auto_open'] = self.auto_open_var
+        self._settings = {key: var.get() for key, var in self._config_vars.items()}
+        for key, var in self._config_vars.items():
+            var.trace_add('write', lambda *_, key=key: self._config_var_changed(key))
+        
         # Action buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=20)
@@ -237,36 +291,47 @@ class SimplifiedGlucoseGUI:
         self.status_frame = ttk.Frame(main_frame)
         self.status_frame.pack(fill=tk.X, pady=(10, 0))
         
+        self.status_frame.columnconfigure(0, weight=1)
+        
         self.status_label = ttk.Label(self.status_frame, text="Ready", relief=tk.SUNKEN)
-        self.status_label.pack(fill=tk.X)
+        self.status_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
-        # Progress bar
+        # Progress bar; grid_remove keeps its grid options so showing it
+        # again during a conversion is a plain grid() call
         self.progress_bar = ttk.Progressbar(
             self.status_frame,
-            mode='indeterminate',
+            mode='determinate',
+            maximum=100,
             length=200
         )
+        self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=5)
+        self.progress_bar.grid_remove()
         
         # Initial UI state
         self.update_filter_ui()
     
+    @staticmethod
+    def _validate_date_char(new_text):
+        """Allow only digits and dots, up to the length of DD.MM.YYYY"""
+        return _DATE_INPUT_RE.match(new_text) is not None
+    
     def update_filter_ui(self):
         """Enable/disable UI elements based on filter mode"""
         mode = self.filter_mode.get()
+        want_custom = mode == "custom"
+        want_days = mode == "days"
         
-        # Disable/enable custom date inputs
-        if mode == "custom":
-            self.start_date_entry.config(state="normal")
-            self.end_date_entry.config(state="normal")
-        else:
-            self.start_date_entry.config(state="disabled")
-            self.end_date_entry.config(state="disabled")
+        # Disable/enable custom date inputs, only when that changes
+        if want_custom != self._ui_state['custom']:
+            state = "normal" if want_custom else "disabled"
+            self.start_date_entry.config(state=state)
+            self.end_date_entry.config(state=state)
+            self._ui_state['custom'] = want_custom
         
         # Disable/enable days spinner
-        if mode == "days":
-            self.days_spin.config(state="normal")
-        else:
-            self.days_spin.config(state="disabled")
+        if want_days != self._ui_state['days']:
+            self.days_spin.config(state="normal" if want_days else "disabled")
+            self._ui_state['days'] = want_days
     
     def setup_drag_drop(self):
         """Setup drag and drop functionality"""
@@ -283,7 +348,7 @@ class SimplifiedGlucoseGUI:
         files = self.root.tk.splitlist(event.data)
         if files:
             file_path = files[0]
-            if file_path.lower().endswith('.csv'):
+            if os.path.splitext(file_path)[1].lower() == '.csv':
                 self.load_file(file_path)
             else:
                 messagebox.showerror("Error", "Please drop a CSV file")
@@ -293,7 +358,7 @@ class SimplifiedGlucoseGUI:
         file_path = filedialog.askopenfilename(
             title="Select Contour CSV File",
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")],
-            initialdir=str(get_downloads_folder())
+            initialdir=self._downloads()
         )
         
         if file_path:
@@ -301,18 +366,19 @@ class SimplifiedGlucoseGUI:
     
     def load_file(self, file_path):
         """Load selected CSV file"""
+        name = os.path.basename(file_path)
         self.current_file = file_path
-        self.file_label.config(text=f"File: {Path(file_path).name}", foreground="black")
+        self.file_label.config(text=f"File: {name}", foreground="black")
         self.convert_btn.config(state="normal")
-        self.update_status(f"Loaded: {Path(file_path).name}")
+        self.update_status(f"Loaded: {name}")
         
         self.drop_label.config(
-            text=f"✅ {Path(file_path).name}\n\nDrop another file to replace",
+            text=f"✅ {name}\n\nDrop another file to replace",
             bg='#e6ffe6'
         )
         
         # Check if incremental export available
-        last_export = self.converter.export_tracker.get_last_export_date(file_path)
+        last_export = self._ensure_converter().export_tracker.get_last_export_date(file_path)
         if last_export:
             self.last_export_label.config(
                 text=f"Last export: {last_export.strftime('%d.%m.%Y %H:%M')}"
@@ -324,12 +390,13 @@ class SimplifiedGlucoseGUI:
         """Auto-detect latest CSV"""
         self.update_status("Searching for latest CSV...")
         
-        downloads = get_downloads_folder()
-        latest_csv = find_latest_csv(str(downloads))
+        from glucose_converter_simplified import find_latest_csv
+        
+        latest_csv = find_latest_csv(self._downloads())
         
         if latest_csv:
             self.load_file(latest_csv)
-            self.update_status(f"Found: {Path(latest_csv).name}")
+            self.update_status(f"Found: {os.path.basename(latest_csv)}")
         else:
             messagebox.showwarning("Not Found", "No Contour CSV files found in Downloads folder")
             self.update_status("No CSV files found")
@@ -342,7 +409,7 @@ class SimplifiedGlucoseGUI:
         )
         
         if file_path:
-            if self.converter.save_template(file_path):
+            if self._ensure_converter().save_template(file_path):
                 messagebox.showinfo("Success", "Template uploaded successfully!\n\nIt will be used for all future conversions.")
             else:
                 messagebox.showerror("Error", "Failed to save template")
@@ -368,56 +435,94 @@ class SimplifiedGlucoseGUI:
             start_date = end_date - timedelta(days=days)
         elif filter_mode == "custom":
             try:
-                start_date = datetime.strptime(self.start_date_var.get(), '%d.%m.%Y')
-                end_date = datetime.strptime(self.end_date_var.get(), '%d.%m.%Y')
+                start_date = _parse_ddmmyyyy(self.start_date_var.get())
+                end_date = _parse_ddmmyyyy(self.end_date_var.get())
             except ValueError:
                 messagebox.showerror("Error", "Invalid date format. Use DD.MM.YYYY")
                 return
         
-        # Update converter settings
-        self.converter.config['low_threshold'] = self.low_threshold_var.get()
-        self.converter.config['high_threshold'] = self.high_threshold_var.get()
-        self.converter.config['very_high_threshold'] = self.very_high_threshold_var.get()
-        self.converter.config['auto_open'] = self.auto_open_var.get()
+        # Snapshot the settings so edits made during the conversion do not
+        # reach it halfway through
+        converter = self._ensure_converter()
+        config = {**converter.config, **self._settings}
         
         # Disable button and show progress
         self.convert_btn.config(state="disabled")
-        self.progress_bar.pack(fill=tk.X, pady=5)
-        self.progress_bar.start(10)
+        self.progress_bar['value'] = 0
+        self.progress_bar.grid()
         self.update_status("Converting...")
         
-        # Run in thread
-        thread = threading.Thread(
-            target=self.run_conversion,
-            args=(start_date, end_date, incremental)
+        # Hand the job to the worker thread and watch for its result
+        self.job_q.put({
+            'csv_path': self.current_file,
+            'start_date': start_date,
+            'end_date': end_date,
+            'incremental': incremental,
+            'config': config
+        })
+        self._pending_jobs += 1
+        if self._pending_jobs == 1:
+            self.root.after(50, self._drain_results)
+    
+    def _worker(self):
+        """Run queued conversions one after another"""
+        while True:
+            job = self.job_q.get()
+            try:
+                output_file = self.run_conversion(
+                    **job,
+                    progress_cb=lambda pct: self.result_q.put(('progress', pct))
+                )
+                if output_file:
+                    self.result_q.put(('success', output_file))
+                else:
+                    self.result_q.put(('error', "No data in specified range"))
+            except Exception as e:
+                self.result_q.put(('error', str(e)))
+    
+    def run_conversion(self, csv_path, start_date, end_date, incremental, config=None,
+                       progress_cb=None):
+        """Run the conversion process
+        
+        ``config`` replaces the converter config before the job starts; the
+        worker only gets here between conversions.
+        """
+        if config is not None:
+            self.converter.config = config
+        return self.converter.convert(
+            csv_path,
+            start_date=start_date,
+            end_date=end_date,
+            incremental=incremental,
+            progress_cb=progress_cb
         )
-        thread.start()
     
-    def run_conversion(self, start_date, end_date, incremental):
-        """Run the conversion process"""
-        try:
-            output_file = self.converter.convert(
-                self.current_file,
-                start_date=start_date,
-                end_date=end_date,
-                incremental=incremental
-            )
+    def _drain_results(self):
+        """Dispatch finished conversions; keeps polling while jobs are queued"""
+        while True:
+            try:
+                status, payload = self.result_q.get_nowait()
+            except queue.Empty:
+                break
+            if status == 'progress':
+                self.progress_bar['value'] = payload
+                continue
             
-            if output_file:
-                self.root.after(0, self.conversion_success, output_file)
+            self._pending_jobs -= 1
+            if status == 'success':
+                self.conversion_success(payload)
             else:
-                self.root.after(0, self.conversion_error, "No data in specified range")
-            
-        except Exception as e:
-            self.root.after(0, self.conversion_error, str(e))
+                self.conversion_error(payload)
+        
+        if self._pending_jobs:
+            self.root.after(50, self._drain_results)
     
     def conversion_success(self, output_file):
         """Handle successful conversion"""
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self.progress_bar.grid_remove()
         self.convert_btn.config(state="normal")
         
-        self.update_status(f"Success! Saved to: {Path(output_file).name}")
+        self.update_status(f"Success! Saved to: {os.path.basename(output_file)}")
         
         # Update last export display
         if self.current_file:
@@ -434,16 +539,22 @@ class SimplifiedGlucoseGUI:
     
     def conversion_error(self, error_msg):
         """Handle conversion error"""
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
+        self.progress_bar.grid_remove()
         self.convert_btn.config(state="normal")
         
         self.update_status("Conversion failed")
         messagebox.showerror("Error", f"Conversion failed:\n{error_msg}")
     
     def update_status(self, message):
-        """Update status bar"""
-        self.status_label.config(text=message)
+        """Update status bar, at most once every 100 ms"""
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after(100, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest pending status message"""
+        self._status_after_id = None
+        self.status_label.config(text=self._pending_status)
 
 
 def main():
@@ -464,15 +575,12 @@ def main():
         print("\nNote: If you see a tkinter error, install it with:")
         print("  sudo apt-get install python3-tk python3.12-tk")
     
-    app = SimplifiedGlucoseGUI(root)
+    # Center window from its known size before building the UI
+    x = (root.winfo_screenwidth() // 2) - (_WINDOW_WIDTH // 2)
+    y = (root.winfo_screenheight() // 2) - (_WINDOW_HEIGHT // 2)
+    root.geometry(f'{_WINDOW_WIDTH}x{_WINDOW_HEIGHT}+{x}+{y}')
     
-    # Center window
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f'{width}x{height}+{x}+{y}')
+    app = SimplifiedGlucoseGUI(root)
     
     root.mainloop()
 
@@ -6,6 +6,9 @@ Purpose: Converts CSV glucose data to formatted XLSX with single template
 """
 
 import os
+import re
+import math
+import bisect
 import sys
 import csv
 import json
@@ -13,15 +16,68 @@ import platform
 import argparse
 import configparser
 import shutil
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterator
 import openpyxl
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; statistics fall back to pure Python
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the tracker is read with the json module
+    orjson = None
+
+# Data rows written between calls to a conversion progress callback
+_PROGRESS_STEP = 1000
+
+# Block size PyArrow tokenizes the CSV in, when it is installed
+_ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Contour CSV columns, in the order read_csv unpacks them
+_CSV_COLUMNS = (
+    'Date and Time',
+    'Readings [mmol/L]',
+    'Meal Marker',
+    'Notes',
+    'Activity',
+    'Meal[g]',
+    'Medication',
+    'Location'
+)
+
+# Minimum number of readings before statistics are computed with NumPy
+_NUMPY_MIN_READINGS = 5000
+
+# Fast path for the usual "DD.M.YY. H:MM" timestamps (seconds are ignored);
+# anything else goes through _parse_datetime
+_DT_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})\.?\s+(\d{1,2}):(\d{2})(?::\d{2})?\s*$')
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow():
+    """Import PyArrow and its CSV reader on first use
+    
+    Returns ``(None, None)`` when it is not installed. Importing Arrow takes
+    longer than converting a typical export, so it is left out of module import.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # PyArrow is optional; CSV files are read with the csv module
+        return None, None
+    return pa, pacsv
+
 
 class ExportTracker:
     """Tracks last export date for incremental exports"""
@@ -33,18 +89,27 @@ class ExportTracker:
     
     def _load_tracker(self) -> Dict:
         """Load export dates from file"""
-        if os.path.exists(self.tracker_file):
-            try:
-                with open(self.tracker_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        try:
+            with open(self.tracker_file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return {}
+        
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:
+            return {}
     
     def save_tracker(self):
-        """Save export dates to file"""
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.last_exports, f, indent=2, default=str)
+        """Save export dates to file
+        
+        The dates are written to a temporary file that then replaces the
+        tracker, so an interrupted save cannot leave a truncated tracker.
+        """
+        tmp_file = self.tracker_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(self.last_exports, f, default=str)
+        os.replace(tmp_file, self.tracker_file)
     
     def get_last_export_date(self, source_file: str) -> Optional[datetime]:
         """Get the last export date for a specific source file"""
@@ -56,9 +121,8 @@ class ExportTracker:
         return None
     
     def update_export(self, source_file: str, latest_date: datetime):
-        """Update the export date for a file"""
+        """Update the export date for a file; call save_tracker to persist it"""
         self.last_exports[source_file] = latest_date.isoformat()
-        self.save_tracker()
 
 
 class SimplifiedGlucoseConverter:
@@ -71,19 +135,62 @@ class SimplifiedGlucoseConverter:
         'very_high': 'E6D9FF'  # Light purple for > 17.9
     }
     
+    # Shared style objects, built once and reused for every cell
+    _HEADER_FONT = Font(bold=True, size=11)
+    _HEADER_FILL = PatternFill(start_color='FFD3D3D3', end_color='FFD3D3D3', fill_type='solid')
+    _HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+    _TITLE_FONT = Font(bold=True, size=12)
+    _BOLD_FONT = Font(bold=True)
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _FILLS = {
+        level: PatternFill(start_color='FF' + color, end_color='FF' + color, fill_type='solid')
+        for level, color in COLORS.items()
+    }
+    
+    # Config keys read from the [Settings] section and their value types
+    _CONFIG_SCHEMA = (
+        ('output_folder', str),
+        ('auto_open', bool),
+        ('date_format', str),
+        ('low_threshold', float),
+        ('high_threshold', float),
+        ('very_high_threshold', float),
+        ('incremental_export', bool),
+        ('date_filter_enabled', bool),
+        ('date_filter_days', int),
+    )
+    
+    # Set by _template_dir() the first time a converter needs it
+    _template_dir_path: Optional[Path] = None
+    
+    # Colors and fills indexed by range: low, normal, high, very high
+    _RANGE_COLORS = (COLORS['low'], None, COLORS['high'], COLORS['very_high'])
+    _RANGE_FILLS = (_FILLS['low'], None, _FILLS['high'], _FILLS['very_high'])
+    
     def __init__(self, config_file: Optional[str] = None):
         """Initialize converter with optional config file"""
         self.config = self._load_config(config_file)
         self.export_tracker = ExportTracker()
         self.template_path = self._get_template_path()
     
+    @classmethod
+    def _template_dir(cls) -> Path:
+        """Template directory, created on first use and shared by all instances"""
+        if cls._template_dir_path is None:
+            template_dir = Path.home() / '.glucose_converter'
+            template_dir.mkdir(exist_ok=True)
+            cls._template_dir_path = template_dir
+        return cls._template_dir_path
+    
     def _get_template_path(self) -> Optional[Path]:
         """Get path to user's template if it exists"""
         # Check for template in config directory
-        template_dir = Path.home() / '.glucose_converter'
-        template_dir.mkdir(exist_ok=True)
-        
-        template_file = template_dir / 'template.xlsx'
+        template_file = self._template_dir() / 'template.xlsx'
         if template_file.exists():
             return template_file
         
@@ -96,10 +203,7 @@ class SimplifiedGlucoseConverter:
     
     def save_template(self, template_file: str) -> bool:
         """Save a template file for future use"""
-        template_dir = Path.home() / '.glucose_converter'
-        template_dir.mkdir(exist_ok=True)
-        
-        dest_path = template_dir / 'template.xlsx'
+        dest_path = self._template_dir() / 'template.xlsx'
         try:
             shutil.copy2(template_file, dest_path)
             self.template_path = dest_path
@@ -123,22 +227,20 @@ class SimplifiedGlucoseConverter:
             'date_filter_days': 30
         }
         
-        if config_file and os.path.exists(config_file):
-            parser = configparser.ConfigParser()
-            parser.read(config_file)
-            
-            if 'Settings' in parser:
-                settings = parser['Settings']
-                for key in config:
-                    if key in settings:
-                        if key in ['auto_open', 'incremental_export', 'date_filter_enabled']:
-                            config[key] = settings.getboolean(key)
-                        elif key in ['low_threshold', 'high_threshold', 'very_high_threshold']:
-                            config[key] = float(settings[key])
-                        elif key == 'date_filter_days':
-                            config[key] = int(settings[key])
-                        else:
-                            config[key] = settings[key] if settings[key] else None
+        # ConfigParser.read() skips missing files and returns the ones it read
+        parser = configparser.ConfigParser()
+        if config_file and parser.read(config_file) and 'Settings' in parser:
+            settings = parser['Settings']
+            for key, value_type in self._CONFIG_SCHEMA:
+                value = settings.get(key)
+                if value is None:
+                    continue
+                if value_type is bool:
+                    config[key] = settings.getboolean(key)
+                elif value_type is str:
+                    config[key] = value or None
+                else:
+                    config[key] = value_type(value)
         
         return config
     
@@ -146,72 +248,171 @@ class SimplifiedGlucoseConverter:
                  end_date: Optional[datetime] = None) -> List[Dict]:
         """Read CSV file with optional date filtering"""
         data = []
-        
-        with open(csv_path, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
+        data_append = data.append
+        dt_match = _DT_RE.match
+        _datetime = datetime
+        filtered = start_date is not None or end_date is not None
+        # Contour exports are normally in time order; only sort if they are not
+        previous = None
+        in_order = True
+        
+        # Let PyArrow tokenize the file when it is installed
+        rows = None
+        pa, pacsv = _load_pyarrow()
+        if pacsv is not None:
+            try:
+                rows = self._arrow_rows(csv_path)
+            except pa.ArrowInvalid:
+                # e.g. ragged rows, which the csv module tolerates
+                pass
+        if rows is None:
+            rows = self._csv_rows(csv_path)
+        
+        for (date_str, glucose_str, meal_marker, notes, activity,
+             meal, medication, location) in rows:
+            date_str = date_str.strip()
+            glucose_str = glucose_str.strip()
             
-            for row in reader:
-                date_str = row.get('Date and Time', '').strip()
-                glucose_str = row.get('Readings [mmol/L]', '').strip()
-                
-                if date_str and glucose_str:
-                    try:
-                        # Parse date: "DD.M.YY. H:MM" format
-                        parts = date_str.split(' ')
-                        date_part = parts[0].rstrip('.')
-                        time_part = parts[1] if len(parts) > 1 else '00:00'
-                        
-                        # Split date components
-                        date_components = date_part.split('.')
-                        if len(date_components) == 3:
-                            day = int(date_components[0])
-                            month = int(date_components[1])
-                            year = int(date_components[2])
-                            # Convert 2-digit year to 4-digit
-                            if year < 100:
-                                year = 2000 + year
-                            
-                            # Parse time
-                            time_components = time_part.split(':')
-                            hour = int(time_components[0])
-                            minute = int(time_components[1]) if len(time_components) > 1 else 0
-                            
-                            # Create datetime object
-                            dt = datetime(year, month, day, hour, minute)
-                            
-                            # Apply date filtering
-                            if start_date and dt < start_date:
-                                continue
-                            if end_date and dt > end_date:
-                                continue
-                            
-                            data.append({
-                                'datetime': dt,
-                                'glucose': float(glucose_str),
-                                'meal_marker': row.get('Meal Marker', ''),
-                                'notes': row.get('Notes', ''),
-                                'activity': row.get('Activity', ''),
-                                'meal': row.get('Meal[g]', ''),
-                                'medication': row.get('Medication', ''),
-                                'location': row.get('Location', '')
-                            })
-                    except (ValueError, IndexError) as e:
-                        print(f"Warning: Could not parse row with date '{date_str}': {e}")
-                        continue
+            if date_str and glucose_str:
+                try:
+                    match = dt_match(date_str)
+                    if match:
+                        day, month, year, hour, minute = map(int, match.groups())
+                        # Convert 2-digit year to 4-digit
+                        if year < 100:
+                            year += 2000
+                        dt = _datetime(year, month, day, hour, minute)
+                    else:
+                        dt = self._parse_datetime(date_str)
+                        if dt is None:
+                            continue
+                    
+                    # Apply date filtering
+                    if filtered:
+                        if start_date and dt < start_date:
+                            continue
+                        if end_date and dt > end_date:
+                            continue
+                    
+                    if in_order and previous is not None and dt < previous:
+                        in_order = False
+                    previous = dt
+                    
+                    data_append({
+                        'datetime': dt,
+                        'glucose': float(glucose_str),
+                        'meal_marker': meal_marker,
+                        'notes': notes,
+                        'activity': activity,
+                        'meal': meal,
+                        'medication': medication,
+                        'location': location
+                    })
+                except (ValueError, IndexError) as e:
+                    print(f"Warning: Could not parse row with date '{date_str}': {e}")
+                    continue
         
         # Sort by datetime
-        data.sort(key=lambda x: x['datetime'])
+        if not in_order:
+            data.sort(key=itemgetter('datetime'))
         return data
     
+    def _csv_rows(self, csv_path: str) -> Iterator[Tuple[str, ...]]:
+        """Yield the raw values of ``_CSV_COLUMNS`` for each row of the file"""
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            
+            # Resolve column positions once; missing columns point at a blank
+            # cell appended to every row
+            width = len(header)
+            positions = {name: idx for idx, name in enumerate(header)}
+            (date_idx, glucose_idx, meal_marker_idx, notes_idx, activity_idx,
+             meal_idx, medication_idx, location_idx) = (
+                positions.get(name, width) for name in _CSV_COLUMNS
+            )
+            
+            for row in reader:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ('',)
+                yield (row[date_idx], row[glucose_idx], row[meal_marker_idx], row[notes_idx],
+                       row[activity_idx], row[meal_idx], row[medication_idx], row[location_idx])
+    
+    def _arrow_rows(self, csv_path: str) -> Iterator[Tuple[str, ...]]:
+        """Return the raw values of ``_CSV_COLUMNS`` for each row, parsed by PyArrow"""
+        pa, pacsv = _load_pyarrow()
+        
+        # Read the header with the csv module so the BOM and quoting are handled
+        # exactly as on the fallback path
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        
+        # Keep every column as text; values are parsed like on the csv path
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(column_names=header, skip_rows=1,
+                                           block_size=_ARROW_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False
+            )
+        )
+        
+        blank = [''] * table.num_rows
+        columns = [
+            table.column(name).to_pylist() if name in header else blank
+            for name in _CSV_COLUMNS
+        ]
+        return zip(*columns)
+    
+    @staticmethod
+    def _parse_datetime(date_str: str) -> Optional[datetime]:
+        """Parse a "DD.M.YY. H:MM" date without the fast-path pattern
+        
+        Used for rows ``_DT_RE`` does not match. Returns None if the date
+        does not have a day, month and year.
+        """
+        parts = date_str.split(' ')
+        date_part = parts[0].rstrip('.')
+        time_part = parts[1] if len(parts) > 1 else '00:00'
+        
+        # Split date components
+        date_components = date_part.split('.')
+        if len(date_components) != 3:
+            return None
+        
+        day = int(date_components[0])
+        month = int(date_components[1])
+        year = int(date_components[2])
+        # Convert 2-digit year to 4-digit
+        if year < 100:
+            year = 2000 + year
+        
+        # Parse time
+        time_components = time_part.split(':')
+        hour = int(time_components[0])
+        minute = int(time_components[1]) if len(time_components) > 1 else 0
+        
+        return datetime(year, month, day, hour, minute)
+    
+    def _threshold_bounds(self) -> Tuple[float, float, float]:
+        """Sorted range bounds for bisect lookups against the current config"""
+        # Readings equal to the low threshold count as normal, so shift the
+        # low bound just below it to keep a single bisect_left lookup
+        return (
+            math.nextafter(self.config['low_threshold'], -math.inf),
+            self.config['high_threshold'],
+            self.config['very_high_threshold']
+        )
+    
     def get_cell_color(self, glucose_value: float) -> Optional[str]:
         """Determine cell background color based on glucose value"""
-        if glucose_value < self.config['low_threshold']:
-            return self.COLORS['low']
-        elif glucose_value > self.config['very_high_threshold']:
-            return self.COLORS['very_high']
-        elif glucose_value > self.config['high_threshold']:
-            return self.COLORS['high']
-        return None
+        return self._RANGE_COLORS[bisect.bisect_left(self._threshold_bounds(), glucose_value)]
+    
+    def get_cell_fill(self, glucose_value: float) -> Optional[PatternFill]:
+        """Return the shared fill for a glucose value, or None if in range"""
+        return self._RANGE_FILLS[bisect.bisect_left(self._threshold_bounds(), glucose_value)]
     
     def apply_template_formatting(self, ws: Worksheet, template_ws: Worksheet, data_rows: int):
         """Apply formatting from template to worksheet"""
@@ -251,8 +452,13 @@ class SimplifiedGlucoseConverter:
                     wrap_text=template_cell.alignment.wrap_text
                 )
     
-    def create_xlsx(self, data: List[Dict], output_path: str):
-        """Create XLSX using template if available or default formatting"""
+    def create_xlsx(self, data: List[Dict], output_path: str,
+                    progress_cb: Optional[Callable[[int], None]] = None):
+        """Create XLSX using template if available or default formatting
+        
+        ``progress_cb`` is called with the percentage of data rows written
+        (up to 99) every ``_PROGRESS_STEP`` rows.
+        """
         
         # Try to load template
         template_wb = None
@@ -263,18 +469,6 @@ class SimplifiedGlucoseConverter:
             except Exception as e:
                 print(f"⚠️ Could not load template: {e}")
         
-        if template_wb:
-            wb = template_wb
-            ws = wb.active
-            # Clear existing data rows (keep header)
-            for row in range(2, ws.max_row + 1):
-                for col in range(1, ws.max_column + 1):
-                    ws.cell(row=row, column=col).value = None
-        else:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Glucose Readings"
-        
         # Define headers
         headers = [
             'Date and Time',
@@ -287,88 +481,63 @@ class SimplifiedGlucoseConverter:
             'Location'
         ]
         
-        # Apply default formatting if no template
-        if not template_wb:
-            header_font = Font(bold=True, size=11)
-            header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
-            header_alignment = Alignment(horizontal='center', vertical='center')
-            
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+        if template_wb:
+            wb = template_wb
+            ws = wb.active
+            # A template that only styles the header row gets each reading
+            # appended as one row; otherwise clear the existing data rows
+            # (keep header) and write cell by cell so pre-styled rows keep
+            # their formatting
+            append_rows = ws.max_row <= 1
+            if not append_rows:
+                for row in ws.iter_rows(min_row=2):
+                    for cell in row:
+                        cell.value = None
             
-            # Write headers
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
-        else:
             # Update headers if using template
             for col, header in enumerate(headers, 1):
                 ws.cell(row=1, column=col, value=header)
-        
-        # Write data rows
-        for row_idx, row_data in enumerate(data, 2):
-            # Date and Time column
-            date_cell = ws.cell(
-                row=row_idx, 
-                column=1, 
-                value=row_data['datetime'].strftime(self.config['date_format'])
-            )
             
-            # Glucose value column with color coding
-            glucose_cell = ws.cell(row=row_idx, column=2, value=row_data['glucose'])
+            # Look up settings once instead of on every row
+            date_format = self.config['date_format']
+            bounds = self._threshold_bounds()
+            range_fills = self._RANGE_FILLS
+            bisect_left = bisect.bisect_left
+            append = ws.append
+            total_rows = len(data)
             
-            # Apply color based on glucose level
-            color = self.get_cell_color(row_data['glucose'])
-            if color:
-                glucose_cell.fill = PatternFill(
-                    start_color=color, 
-                    end_color=color, 
-                    fill_type='solid'
+            # Write data rows
+            for row_num, row_data in enumerate(data, 1):
+                glucose = row_data['glucose']
+                row_values = (
+                    row_data['datetime'].strftime(date_format),
+                    glucose,
+                    row_data['meal_marker'] or '',
+                    row_data['notes'] or '',
+                    row_data['activity'] or '',
+                    row_data['meal'] or '',
+                    row_data['medication'] or '',
+                    row_data['location'] or ''
                 )
-            
-            # Other columns
-            other_values = [
-                row_data['meal_marker'],
-                row_data['notes'],
-                row_data['activity'],
-                row_data['meal'],
-                row_data['medication'],
-                row_data['location']
-            ]
-            
-            for col_idx, value in enumerate(other_values, 3):
-                ws.cell(row=row_idx, column=col_idx, value=value if value else '')
-            
-            # Apply borders if not using template
-            if not template_wb:
-                for col in range(1, 9):
-                    ws.cell(row=row_idx, column=col).border = thin_border
-        
-        # Auto-adjust column widths if no template
-        if not template_wb:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
+                if append_rows:
+                    append(row_values)
+                else:
+                    for col_idx, value in enumerate(row_values, 1):
+                        ws.cell(row=row_num + 1, column=col_idx, value=value)
                 
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
+                # Apply color based on glucose level
+                fill = range_fills[bisect_left(bounds, glucose)]
+                if fill:
+                    ws.cell(row=row_num + 1, column=2).fill = fill
                 
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-        
-        # Add statistics
-        self._add_statistics(ws, data, len(data) + 3)
+                if progress_cb and row_num % _PROGRESS_STEP == 0:
+                    progress_cb(min(row_num * 100 // total_rows, 99))
+            
+            # Add statistics below the data; leftover template rows may
+            # follow it, so place them explicitly when writing cell by cell
+            self._add_statistics(ws, data, None if append_rows else len(data) + 3)
+        else:
+            wb = self._build_workbook(data, headers, progress_cb)
         
         # Save the workbook
         wb.save(output_path)
@@ -378,28 +547,166 @@ class SimplifiedGlucoseConverter:
         if self.config['auto_open']:
             self._open_file(output_path)
     
-    def _add_statistics(self, ws: Worksheet, data: List[Dict], start_row: int):
-        """Add statistics summary to worksheet"""
+    def _build_workbook(self, data: List[Dict], headers: List[str],
+                        progress_cb: Optional[Callable[[int], None]] = None) -> Workbook:
+        """Build a write-only workbook with the default formatting
+        
+        Rows are streamed to the sheet with ``ws.append`` instead of keeping
+        every cell object in memory.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Glucose Readings")
+        
+        # Prepare row values up front; write-only sheets do not allow column
+        # widths to be changed once rows have been appended
+        date_format = self.config['date_format']
+        rows = []
+        widths = [len(header) for header in headers]
+        for row_data in data:
+            row_values = (
+                row_data['datetime'].strftime(date_format),
+                row_data['glucose'],
+                row_data['meal_marker'] or '',
+                row_data['notes'] or '',
+                row_data['activity'] or '',
+                row_data['meal'] or '',
+                row_data['medication'] or '',
+                row_data['location'] or ''
+            )
+            rows.append(row_values)
+            
+            # Track the widest value per column as rows are built
+            for col_idx, value in enumerate(row_values):
+                length = len(value) if col_idx != 1 else len(str(value))
+                if length > widths[col_idx]:
+                    widths[col_idx] = length
+        
+        # Auto-adjust column widths
+        for col_idx, max_length in enumerate(widths, 1):
+            adjusted_width = min(max(max_length + 2, 10), 50)
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+        
+        wb.add_named_style(NamedStyle(
+            'header',
+            font=self._HEADER_FONT,
+            fill=self._HEADER_FILL,
+            alignment=self._HEADER_ALIGNMENT,
+            border=self._THIN_BORDER
+        ))
+        wb.add_named_style(NamedStyle('data', border=self._THIN_BORDER))
+        
+        # Write headers
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = 'header'
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Look up settings once instead of on every row
+        bounds = self._threshold_bounds()
+        range_fills = self._RANGE_FILLS
+        bisect_left = bisect.bisect_left
+        append = ws.append
+        total_rows = len(rows)
+        
+        # Write data rows
+        for row_num, row_values in enumerate(rows, 1):
+            row_cells = []
+            for value in row_values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = 'data'
+                row_cells.append(cell)
+            
+            # Apply color based on glucose level
+            fill = range_fills[bisect_left(bounds, row_values[1])]
+            if fill:
+                row_cells[1].fill = fill
+            
+            append(row_cells)
+            
+            if progress_cb and row_num % _PROGRESS_STEP == 0:
+                progress_cb(min(row_num * 100 // total_rows, 99))
+        
+        # Add statistics
+        self._add_statistics(ws, data)
+        
+        return wb
+    
+    def _add_statistics(self, ws: Worksheet, data: List[Dict], start_row: Optional[int] = None):
+        """Add statistics summary to worksheet
+        
+        Without ``start_row`` the summary is appended after an empty row,
+        which works for both regular and write-only worksheets. Otherwise it
+        is written cell by cell starting at ``start_row``.
+        """
         if not data:
             return
         
-        glucose_values = [d['glucose'] for d in data]
-        avg_glucose = sum(glucose_values) / len(glucose_values)
-        min_glucose = min(glucose_values)
-        max_glucose = max(glucose_values)
+        if start_row is not None:
+            ws.cell(row=start_row, column=1, value='STATISTICS').font = self._TITLE_FONT
+            for idx, (label, value) in enumerate(self._statistics(data), 1):
+                label_cell = ws.cell(row=start_row + idx, column=1, value=label)
+                ws.cell(row=start_row + idx, column=2, value=value)
+                if 'STATISTICS' in label or 'DISTRIBUTION' in label:
+                    label_cell.font = self._BOLD_FONT
+            return
         
-        # Count readings in different ranges
-        low_count = sum(1 for v in glucose_values if v < self.config['low_threshold'])
-        normal_count = sum(1 for v in glucose_values if self.config['low_threshold'] <= v <= self.config['high_threshold'])
-        high_count = sum(1 for v in glucose_values if self.config['high_threshold'] < v <= self.config['very_high_threshold'])
-        very_high_count = sum(1 for v in glucose_values if v > self.config['very_high_threshold'])
+        ws.append([])
+        title_cell = WriteOnlyCell(ws, value='STATISTICS')
+        title_cell.font = self._TITLE_FONT
+        ws.append([title_cell])
+        
+        for label, value in self._statistics(data):
+            label_cell = WriteOnlyCell(ws, value=label)
+            if 'STATISTICS' in label or 'DISTRIBUTION' in label:
+                label_cell.font = self._BOLD_FONT
+            ws.append([label_cell, value])
+    
+    def _statistics(self, data: List[Dict]) -> List[Tuple[str, Any]]:
+        """Label/value rows for the statistics summary"""
+        low = self.config['low_threshold']
+        high = self.config['high_threshold']
+        very_high = self.config['very_high_threshold']
+        
+        if np is not None and len(data) >= _NUMPY_MIN_READINGS:
+            values = np.fromiter((d['glucose'] for d in data), dtype=np.float64, count=len(data))
+            avg_glucose = float(values.mean())
+            min_glucose = float(values.min())
+            max_glucose = float(values.max())
+            
+            # Count readings in different ranges
+            low_count = int((values < low).sum())
+            very_high_count = int((values > very_high).sum())
+            high_count = int(((values > high) & (values <= very_high)).sum())
+            normal_count = len(data) - low_count - high_count - very_high_count
+        else:
+            # Accumulate everything in a single pass over the readings
+            total = 0.0
+            min_glucose = max_glucose = data[0]['glucose']
+            low_count = normal_count = high_count = very_high_count = 0
+            for d in data:
+                v = d['glucose']
+                total += v
+                if v < min_glucose:
+                    min_glucose = v
+                elif v > max_glucose:
+                    max_glucose = v
+                
+                if v < low:
+                    low_count += 1
+                elif v <= high:
+                    normal_count += 1
+                elif v <= very_high:
+                    high_count += 1
+                else:
+                    very_high_count += 1
+            avg_glucose = total / len(data)
         
         # Date range info
         date_range = f"{data[0]['datetime'].strftime('%d.%m.%Y')} - {data[-1]['datetime'].strftime('%d.%m.%Y')}"
         
-        ws.cell(row=start_row, column=1, value='STATISTICS').font = Font(bold=True, size=12)
-        
-        stats = [
+        return [
             ('Date Range:', date_range),
             ('Total Readings:', len(data)),
             ('Average Glucose:', f'{avg_glucose:.1f} mmol/L'),
@@ -412,13 +719,6 @@ class SimplifiedGlucoseConverter:
             (f'High ({self.config["high_threshold"]}-{self.config["very_high_threshold"]} mmol/L):', f'{high_count} ({high_count/len(data)*100:.1f}%)' if data else '0 (0%)'),
             (f'Very High (> {self.config["very_high_threshold"]} mmol/L):', f'{very_high_count} ({very_high_count/len(data)*100:.1f}%)' if data else '0 (0%)')
         ]
-        
-        for idx, (label, value) in enumerate(stats, 1):
-            label_cell = ws.cell(row=start_row + idx, column=1, value=label)
-            value_cell = ws.cell(row=start_row + idx, column=2, value=value)
-            
-            if 'STATISTICS' in label or 'DISTRIBUTION' in label:
-                label_cell.font = Font(bold=True)
     
     def _open_file(self, filepath: str):
         """Open file with cross-platform support"""
@@ -439,8 +739,12 @@ class SimplifiedGlucoseConverter:
     def convert(self, csv_path: str, output_path: Optional[str] = None,
                 start_date: Optional[datetime] = None,
                 end_date: Optional[datetime] = None,
-                incremental: bool = None) -> str:
-        """Main conversion with date filtering"""
+                incremental: bool = None,
+                progress_cb: Optional[Callable[[int], None]] = None) -> str:
+        """Main conversion with date filtering
+        
+        ``progress_cb`` receives the write progress as a percentage.
+        """
         
         # Validate input file
         if not os.path.exists(csv_path):
@@ -496,12 +800,14 @@ class SimplifiedGlucoseConverter:
         
         # Create XLSX file
         print(f"📝 Creating formatted XLSX file...")
-        self.create_xlsx(data, str(output_path))
+        self.create_xlsx(data, str(output_path), progress_cb)
         
         # Update export tracker if incremental
         if incremental and data:
-            latest_date = max(d['datetime'] for d in data)
+            # read_csv returns the readings sorted by date
+            latest_date = data[-1]['datetime']
             self.export_tracker.update_export(csv_path, latest_date)
+            self.export_tracker.save_tracker()
             print(f"📅 Saved last export date: {latest_date.strftime('%d.%m.%Y %H:%M')}")
         
         return str(output_path)
@@ -509,14 +815,25 @@ class SimplifiedGlucoseConverter:
 
 def find_latest_csv(folder_path: str) -> Optional[str]:
     """Find the most recent Contour CSV file in a folder"""
-    folder = Path(folder_path)
-    csv_files = list(folder.glob('ContourCSVReport*.csv'))
+    latest_path = None
+    latest_mtime = None
     
-    if not csv_files:
+    try:
+        with os.scandir(folder_path) as entries:
+            # Track the newest file in one pass instead of sorting them all;
+            # DirEntry caches stat results, so each file is stat'ed once
+            for entry in entries:
+                if (entry.name.startswith('ContourCSVReport')
+                        and entry.name.endswith('.csv')
+                        and entry.is_file()):
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_mtime = mtime
+                        latest_path = entry.path
+    except FileNotFoundError:
         return None
     
-    csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    return str(csv_files[0])
+    return latest_path
 
 
 def get_downloads_folder() -> Path:
@@ -6,10 +6,12 @@ Tests all features including template support, date filtering, and cross-platfor
 
 import unittest
 import tempfile
+import io
 import os
 import shutil
 import csv
 import json
+import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
 import platform
@@ -23,22 +25,43 @@ from glucose_converter_enhanced import (
     find_latest_csv,
     get_downloads_folder
 )
+import glucose_converter
+import glucose_converter_simplified
 
 import openpyxl
+from openpyxl.styles import Font, Border, Side
 
 
+def load_for_reading(path):
+    """Open an XLSX file lazily for reading values; close it when done"""
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    # Write-only output has no stored dimensions, so size the sheet from its rows
+    wb.active.calculate_dimension(force=True)
+    return wb
+
+
+def _empty_xlsx_bytes():
+    """Serialize an empty workbook once for tests that only need a valid file"""
+    buffer = io.BytesIO()
+    openpyxl.Workbook().save(buffer)
+    return buffer.getvalue()
+
+
+EMPTY_XLSX = _empty_xlsx_bytes()
+
 class TestExportTracker(unittest.TestCase):
     """Test the ExportTracker class"""
     
     def setUp(self):
         """Create temporary tracker file"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.tracker_file = os.path.join(self.temp_dir, 'tracker.json')
         self.tracker = ExportTracker(self.tracker_file)
     
     def tearDown(self):
         """Clean up temp files"""
-        shutil.rmtree(self.temp_dir)
+        self._temp_dir.cleanup()
     
     def test_empty_tracker(self):
         """Test empty tracker initialization"""
@@ -66,6 +89,16 @@ class TestExportTracker(unittest.TestCase):
         retrieved_date = self.tracker.get_last_export_date(test_file)
         self.assertEqual(retrieved_date, test_date)
     
+    def test_batched_updates(self):
+        """Test updates inside a with block are written once on exit"""
+        with self.tracker as tracker:
+            tracker.update_export('a.csv', datetime(2025, 1, 10))
+            tracker.update_export('b.csv', datetime(2025, 1, 11))
+            self.assertFalse(os.path.exists(self.tracker_file))
+        
+        new_tracker = ExportTracker(self.tracker_file)
+        self.assertEqual(set(new_tracker.history), {'a.csv', 'b.csv'})
+    
     def test_load_existing_history(self):
         """Test loading existing history file"""
         # Create history file
@@ -92,12 +125,13 @@ class TestTemplateManager(unittest.TestCase):
     
     def setUp(self):
         """Create temporary template directory"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.manager = TemplateManager(self.temp_dir)
     
     def tearDown(self):
         """Clean up temp files"""
-        shutil.rmtree(self.temp_dir)
+        self._temp_dir.cleanup()
     
     def test_empty_templates(self):
         """Test empty template list"""
@@ -107,9 +141,8 @@ class TestTemplateManager(unittest.TestCase):
     def test_save_and_list_template(self):
         """Test saving and listing templates"""
         # Create a dummy XLSX file
-        wb = openpyxl.Workbook()
         temp_file = os.path.join(self.temp_dir, 'temp.xlsx')
-        wb.save(temp_file)
+        Path(temp_file).write_bytes(EMPTY_XLSX)
         
         # Save as template
         self.manager.save_template(temp_file, 'test_template')
@@ -136,9 +169,10 @@ class TestTemplateManager(unittest.TestCase):
         self.manager.save_template(temp_file, 'test_template')
         
         # Load template
-        loaded_wb = self.manager.load_template('test_template')
+        loaded_wb = load_for_reading(str(self.manager.get_template_path('test_template')))
         self.assertIsNotNone(loaded_wb)
         self.assertEqual(loaded_wb.active['A1'].value, 'Test Header')
+        loaded_wb.close()
     
     def test_nonexistent_template(self):
         """Test loading nonexistent template"""
@@ -147,33 +181,70 @@ class TestTemplateManager(unittest.TestCase):
         
         loaded = self.manager.load_template('nonexistent')
         self.assertIsNone(loaded)
+    
+    def test_delete_template(self):
+        """Test deleting a template bumps the version"""
+        temp_file = os.path.join(self.temp_dir, 'temp.xlsx')
+        Path(temp_file).write_bytes(EMPTY_XLSX)
+        
+        self.manager.save_template(temp_file, 'test_template')
+        version = self.manager.version
+        
+        self.assertTrue(self.manager.delete_template('test_template'))
+        self.assertNotIn('test_template', self.manager.list_templates())
+        self.assertGreater(self.manager.version, version)
+        
+        # Deleting again reports the template as missing
+        self.assertFalse(self.manager.delete_template('test_template'))
 
 
 class TestGlucoseConverter(unittest.TestCase):
     """Test the main converter functionality"""
     
+    # Fixed reference time so sample data and date filters line up
+    NOW = datetime.now()
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample CSV once for all tests"""
+        cls._shared_dir = tempfile.TemporaryDirectory()
+        cls.shared_dir = cls._shared_dir.name
+        cls.sample_csv = os.path.join(cls.shared_dir, 'sample_glucose.csv')
+        cls.write_sample_csv(cls.sample_csv)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared sample"""
+        cls._shared_dir.cleanup()
+    
     def setUp(self):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.converter = EnhancedGlucoseConverter()
         
-        # Create sample CSV data
+        # Copy the sample CSV data; tests may rewrite their own copy
         self.csv_file = os.path.join(self.temp_dir, 'test_glucose.csv')
-        self.create_sample_csv()
+        shutil.copyfile(self.sample_csv, self.csv_file)
     
     def tearDown(self):
         """Clean up"""
-        shutil.rmtree(self.temp_dir)
+        self._temp_dir.cleanup()
+    
+    def create_sample_csv(self, num_days=10, end=None):
+        """Create this test's sample CSV file with glucose data"""
+        self.write_sample_csv(self.csv_file, num_days, end)
     
-    def create_sample_csv(self, num_days=10):
-        """Create sample CSV file with glucose data"""
+    @classmethod
+    def write_sample_csv(cls, csv_file, num_days=10, end=None):
+        """Write a sample CSV file with glucose data ending shortly before ``end``"""
         headers = [
             '#', 'Date and Time', 'Readings [mmol/L]', 'Meal Marker',
             'Data Source', 'Notes', 'Activity', 'Meal[g]', 'Medication', 'Location'
         ]
         
         data = []
-        base_date = datetime.now() - timedelta(days=num_days)
+        base_date = (end or cls.NOW) - timedelta(days=num_days)
         
         for i in range(num_days * 4):  # 4 readings per day
             date = base_date + timedelta(hours=i*6)
@@ -195,7 +266,7 @@ class TestGlucoseConverter(unittest.TestCase):
                 ''
             ])
         
-        with open(self.csv_file, 'w', newline='', encoding='utf-8-sig') as f:
+        with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
             writer = csv.writer(f)
             writer.writerow(headers)
             writer.writerows(data)
@@ -223,7 +294,7 @@ class TestGlucoseConverter(unittest.TestCase):
         all_data = self.converter.read_csv(self.csv_file)
         
         # Read with date filter
-        end_date = datetime.now()
+        end_date = self.NOW
         start_date = end_date - timedelta(days=3)
         
         filtered_data = self.converter.read_csv(
@@ -240,6 +311,14 @@ class TestGlucoseConverter(unittest.TestCase):
             self.assertGreaterEqual(row['datetime'], start_date)
             self.assertLessEqual(row['datetime'], end_date)
     
+    def test_iter_csv_chunks(self):
+        """Test chunked reading yields the same readings as read_csv"""
+        chunks = list(self.converter.iter_csv_chunks(self.csv_file, chunk_size=15))
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [15, 15, 10])
+        self.assertEqual([row for chunk in chunks for row in chunk],
+                         self.converter.read_csv(self.csv_file))
+    
     def test_glucose_color_coding(self):
         """Test glucose level color determination"""
         # Test low glucose
@@ -258,6 +337,15 @@ class TestGlucoseConverter(unittest.TestCase):
         color = self.converter.get_cell_color(20.0)
         self.assertEqual(color, self.converter.COLORS['very_high'])
     
+    def test_glucose_fill(self):
+        """Test range fills are shared and match the range colors"""
+        self.assertIsNone(self.converter.get_cell_fill(7.0))
+        self.assertIs(self.converter.get_cell_fill(3.5), self.converter.get_cell_fill(3.0))
+        
+        for value, level in ((3.5, 'low'), (15.0, 'high'), (20.0, 'very_high')):
+            fill = self.converter.get_cell_fill(value)
+            self.assertEqual(fill.start_color.rgb[-6:], self.converter.COLORS[level])
+    
     def test_xlsx_creation(self):
         """Test XLSX file creation"""
         data = self.converter.read_csv(self.csv_file)
@@ -269,7 +357,7 @@ class TestGlucoseConverter(unittest.TestCase):
         self.assertTrue(os.path.exists(output_file))
         
         # Load and verify XLSX
-        wb = openpyxl.load_workbook(output_file)
+        wb = load_for_reading(output_file)
         ws = wb.active
         
         # Check headers
@@ -280,14 +368,57 @@ class TestGlucoseConverter(unittest.TestCase):
         self.assertGreater(ws.max_row, len(data))  # Data + headers + stats
         
         # Check glucose value formatting
-        for row in range(2, len(data) + 2):
-            glucose_cell = ws.cell(row=row, column=2)
+        for (glucose_cell,) in ws.iter_rows(min_row=2, max_row=len(data) + 1,
+                                            min_col=2, max_col=2):
             self.assertIsNotNone(glucose_cell.value)
             
             # Check color coding applied
             if glucose_cell.value < 4.0:
                 self.assertIsNotNone(glucose_cell.fill.start_color)
+        
+        wb.close()
     
+    def test_fast_xlsx_creation(self):
+        """Test the direct XLSX writer matches the openpyxl output"""
+        data = self.converter.read_csv(self.csv_file)
+        default_file = os.path.join(self.temp_dir, 'default.xlsx')
+        fast_file = os.path.join(self.temp_dir, 'fast.xlsx')
+
+        self.converter.create_xlsx_with_template(data, default_file)
+        self.converter._write_xlsx_raw(data, fast_file)
+
+        default_ws = openpyxl.load_workbook(default_file).active
+        fast_ws = openpyxl.load_workbook(fast_file).active
+
+        # Check same values, range colors and column widths
+        for default_row, fast_row in zip(default_ws.iter_rows(), fast_ws.iter_rows()):
+            for default_cell, fast_cell in zip(default_row, fast_row):
+                self.assertEqual(fast_cell.value, default_cell.value)
+                self.assertEqual(fast_cell.fill.fill_type, default_cell.fill.fill_type)
+                if default_cell.fill.fill_type:
+                    self.assertEqual(fast_cell.fill.start_color.rgb, default_cell.fill.start_color.rgb)
+
+        self.assertEqual(fast_ws.max_row, default_ws.max_row)
+        self.assertEqual(fast_ws.column_dimensions['A'].width, default_ws.column_dimensions['A'].width)
+
+    def test_fast_xlsx_non_finite(self):
+        """Test the direct XLSX writer stores NaN and infinity as text"""
+        data = self.converter.read_csv(self.csv_file)
+        data[0]['glucose'] = float('nan')
+        data[1]['glucose'] = float('inf')
+        fast_file = os.path.join(self.temp_dir, 'fast.xlsx')
+
+        self.converter._write_xlsx_raw(data, fast_file)
+
+        with zipfile.ZipFile(fast_file) as archive:
+            sheet_xml = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertNotIn('<v>nan</v>', sheet_xml)
+        self.assertNotIn('<v>inf</v>', sheet_xml)
+
+        fast_ws = openpyxl.load_workbook(fast_file).active
+        self.assertEqual(fast_ws['B2'].value, 'nan')
+        self.assertEqual(fast_ws['B3'].value, 'inf')
+
     def test_template_application(self):
         """Test applying template to output"""
         # Create a template
@@ -295,7 +426,7 @@ class TestGlucoseConverter(unittest.TestCase):
         template_ws = template_wb.active
         
         # Set custom formatting in template
-        template_ws['A1'].font = openpyxl.styles.Font(bold=True, size=14)
+        template_ws['A1'].font = Font(bold=True, size=14)
         template_ws.column_dimensions['A'].width = 20
         
         # Save template
@@ -332,18 +463,21 @@ class TestGlucoseConverter(unittest.TestCase):
         self.assertIsNotNone(last_export)
         
         # Create new CSV with additional data
-        self.create_sample_csv(num_days=15)  # More data
+        self.create_sample_csv(num_days=15, end=self.NOW + timedelta(days=2))  # More data
         
         # Second incremental export
         output2 = os.path.join(self.temp_dir, 'output2.xlsx')
         result2 = self.converter.convert(self.csv_file, output2, incremental=True)
         
         # Load both files and compare
-        wb1 = openpyxl.load_workbook(output1)
-        wb2 = openpyxl.load_workbook(output2)
+        wb1 = load_for_reading(output1)
+        wb2 = load_for_reading(output2)
         
         # Second file should have fewer rows (only new data)
         self.assertLess(wb2.active.max_row, wb1.active.max_row)
+        
+        wb1.close()
+        wb2.close()
     
     def test_cross_platform_paths(self):
         """Test cross-platform path handling"""
@@ -391,11 +525,17 @@ date_filter_days = 7
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions"""
     
+    def setUp(self):
+        """Look the downloads folder up afresh under each test's mocks"""
+        get_downloads_folder.cache_clear()
+    
+    def tearDown(self):
+        """Drop any downloads folder cached under a mock"""
+        get_downloads_folder.cache_clear()
+    
     def test_find_latest_csv(self):
         """Test finding latest CSV file"""
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
+        with tempfile.TemporaryDirectory() as temp_dir:
             # Create multiple CSV files with different timestamps
             files = []
             for i in range(3):
@@ -413,19 +553,12 @@ class TestUtilityFunctions(unittest.TestCase):
             
             self.assertIsNotNone(latest)
             self.assertTrue(latest.endswith('ContourCSVReport_0.csv'))
-            
-        finally:
-            shutil.rmtree(temp_dir)
     
     def test_find_no_csv(self):
         """Test when no CSV files found"""
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
+        with tempfile.TemporaryDirectory() as temp_dir:
             latest = find_latest_csv(temp_dir)
             self.assertIsNone(latest)
-        finally:
-            shutil.rmtree(temp_dir)
     
     @patch('platform.system')
     def test_downloads_folder_windows(self, mock_system):
@@ -454,16 +587,299 @@ class TestUtilityFunctions(unittest.TestCase):
                        str(downloads).endswith('downloads'))
 
 
+class TestBasicConverter(unittest.TestCase):
+    """Test the basic converter"""
+    
+    def setUp(self):
+        """Setup test environment with a private conversion cache"""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
+        self.cache_dir = Path(self.temp_dir) / 'cache'
+        cache_patch = patch.object(glucose_converter, '_CACHE_DIR', self.cache_dir)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        
+        self.converter = glucose_converter.GlucoseConverter()
+        self.csv_file = os.path.join(self.temp_dir, 'ContourCSVReport_test.csv')
+        TestGlucoseConverter.write_sample_csv(self.csv_file)
+    
+    def tearDown(self):
+        """Clean up"""
+        self._temp_dir.cleanup()
+    
+    def convert(self, name):
+        """Convert the sample CSV, returning the output path and whether the XLSX was built"""
+        output_file = os.path.join(self.temp_dir, name)
+        with patch.object(self.converter, 'create_xlsx',
+                          wraps=self.converter.create_xlsx) as create_xlsx:
+            self.converter.convert(self.csv_file, output_file)
+        return output_file, create_xlsx.called
+    
+    def test_read_csv(self):
+        """Test CSV parsing with missing columns, short rows and bad dates"""
+        with open(self.csv_file, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Readings [mmol/L]', 'Date and Time', 'Meal Marker', 'Notes'])
+            writer.writerow(['5.5', '14.5.25. 6:31', 'Fasting', 'note'])
+            writer.writerow(['7.0', '2.11.2025.'])
+            writer.writerow(['8.0', 'not a date', '', ''])
+        
+        data = self.converter.read_csv(self.csv_file)
+        
+        self.assertEqual([row['datetime'] for row in data],
+                         [datetime(2025, 5, 14, 6, 31), datetime(2025, 11, 2)])
+        self.assertEqual([row['glucose'] for row in data], [5.5, 7.0])
+        self.assertEqual(data[0]['notes'], 'note')
+        self.assertEqual(data[1]['meal_marker'], '')
+        self.assertEqual(data[0]['location'], '')
+    
+    def test_xlsx_output(self):
+        """Test the streamed XLSX has color-coded readings followed by statistics"""
+        output_file, _ = self.convert('output.xlsx')
+        data = self.converter.read_csv(self.csv_file)
+        
+        wb = load_for_reading(output_file)
+        ws = wb.active
+        self.assertEqual(ws['A1'].value, 'Date and Time')
+        
+        for reading, (glucose_cell,) in zip(data, ws.iter_rows(min_row=2, max_row=len(data) + 1,
+                                                               min_col=2, max_col=2)):
+            self.assertEqual(glucose_cell.value, reading['glucose'])
+            color = self.converter.get_cell_color(reading['glucose'])
+            if color:
+                self.assertEqual(glucose_cell.fill.start_color.rgb[-6:], color)
+            else:
+                self.assertIsNone(glucose_cell.fill.fill_type)
+        
+        stats = {row[0]: row[1] for row in ws.iter_rows(min_row=len(data) + 3, max_col=2,
+                                                         values_only=True)}
+        self.assertEqual(stats['Total Readings:'], len(data))
+        
+        # Statistics are accumulated while the rows are written; check them
+        # against the full list of readings
+        values = [reading['glucose'] for reading in data]
+        self.assertEqual(stats['Average Glucose:'], f'{sum(values) / len(values):.1f} mmol/L')
+        self.assertEqual(stats['Minimum Glucose:'], f'{min(values):.1f} mmol/L')
+        self.assertEqual(stats['Maximum Glucose:'], f'{max(values):.1f} mmol/L')
+        low_count = sum(value < self.converter.config['low_threshold'] for value in values)
+        low_label = f'Low (< {self.converter.config["low_threshold"]} mmol/L):'
+        self.assertTrue(stats[low_label].startswith(f'{low_count} ('))
+        wb.close()
+    
+    def test_progress(self):
+        """Test progress covers both reading the CSV and writing the rows"""
+        TestGlucoseConverter.write_sample_csv(self.csv_file, num_days=600)
+        reported = []
+        self.converter.convert(self.csv_file, os.path.join(self.temp_dir, 'output.xlsx'),
+                               progress=reported.append)
+        
+        self.assertEqual(reported, sorted(reported))
+        self.assertLessEqual(reported[-1], 99)
+        read_share = glucose_converter._READ_PROGRESS_SHARE
+        self.assertTrue(any(0 < value <= read_share for value in reported))
+        self.assertTrue(any(value > read_share for value in reported))
+    
+    def test_cache_disabled_by_default(self):
+        """Test conversions are not cached unless enabled"""
+        self.assertFalse(self.converter.config['use_cache'])
+        
+        _, built = self.convert('output1.xlsx')
+        self.assertTrue(built)
+        _, built = self.convert('output2.xlsx')
+        self.assertTrue(built)
+        self.assertFalse(self.cache_dir.exists())
+    
+    def test_cache_hit(self):
+        """Test an unchanged CSV reuses the cached output"""
+        self.converter.config['use_cache'] = True
+        
+        output1, built = self.convert('output1.xlsx')
+        self.assertTrue(built)
+        output2, built = self.convert('output2.xlsx')
+        self.assertFalse(built)
+        self.assertEqual(Path(output2).read_bytes(), Path(output1).read_bytes())
+    
+    def test_cache_invalidation(self):
+        """Test changed CSV data or output settings miss the cache"""
+        self.converter.config['use_cache'] = True
+        self.convert('output1.xlsx')
+        
+        # Different thresholds
+        self.converter.config['high_threshold'] = 10.0
+        _, built = self.convert('output2.xlsx')
+        self.assertTrue(built)
+        
+        # Rewritten CSV
+        TestGlucoseConverter.write_sample_csv(self.csv_file, num_days=5)
+        _, built = self.convert('output3.xlsx')
+        self.assertTrue(built)
+        
+        # New converter version
+        with patch.object(glucose_converter, '_CACHE_VERSION', glucose_converter._CACHE_VERSION + 1):
+            _, built = self.convert('output4.xlsx')
+        self.assertTrue(built)
+
+
+class TestSimplifiedConverter(unittest.TestCase):
+    """Test the simplified converter"""
+    
+    HEADERS = [
+        '#', 'Date and Time', 'Readings [mmol/L]', 'Meal Marker',
+        'Data Source', 'Notes', 'Activity', 'Meal[g]', 'Medication', 'Location'
+    ]
+    
+    def setUp(self):
+        """Setup test environment"""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
+        self.converter = glucose_converter_simplified.SimplifiedGlucoseConverter()
+        # Ignore any template saved in the user's home folder
+        self.converter.template_path = None
+        self.csv_file = os.path.join(self.temp_dir, 'ContourCSVReport_test.csv')
+    
+    def tearDown(self):
+        """Clean up"""
+        self._temp_dir.cleanup()
+    
+    def write_csv(self, rows):
+        """Write a Contour CSV file with the given data rows"""
+        with open(self.csv_file, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.HEADERS)
+            writer.writerows(rows)
+    
+    def sample_rows(self):
+        """One reading per glucose range, in file order"""
+        return [
+            ['1', '1.1.25. 8:00', '3.5', 'Fasting', 'Meter', '', '', '', '', ''],  # Low
+            ['2', '1.1.25. 12:00', '8.0', 'Before Meal', 'Meter', '', '', '', '', ''],  # Normal
+            ['3', '1.1.25. 18:00', '15.0', 'After Meal', 'Meter', '', '', '', '', ''],  # High
+            ['4', '1.1.25. 22:00', '22.0', 'No mark', 'Meter', '', '', '', '', ''],  # Very high
+        ]
+    
+    def assert_glucose_output(self, output_file, stats_row):
+        """Check the glucose values, range fills and statistics position of an output file"""
+        wb = load_for_reading(output_file)
+        ws = wb.active
+        glucose_cells = [row[0] for row in ws.iter_rows(min_row=2, max_row=5, min_col=2, max_col=2)]
+        
+        self.assertEqual([cell.value for cell in glucose_cells], [3.5, 8.0, 15.0, 22.0])
+        fill_colors = [
+            cell.fill.start_color.rgb[-6:] if cell.fill.fill_type else None
+            for cell in glucose_cells
+        ]
+        colors = self.converter.COLORS
+        self.assertEqual(fill_colors, [colors['low'], None, colors['high'], colors['very_high']])
+        
+        stats_cell = next(ws.iter_rows(min_row=stats_row, max_row=stats_row, max_col=1))[0]
+        self.assertEqual(stats_cell.value, 'STATISTICS')
+        wb.close()
+    
+    def test_read_csv(self):
+        """Test CSV reading sorts readings and applies the date filter"""
+        rows = self.sample_rows()
+        self.write_csv([rows[2], rows[0], rows[3], rows[1]])
+        
+        data = self.converter.read_csv(self.csv_file)
+        self.assertEqual([row['glucose'] for row in data], [3.5, 8.0, 15.0, 22.0])
+        self.assertEqual(data[0]['datetime'], datetime(2025, 1, 1, 8, 0))
+        self.assertEqual(data[0]['meal_marker'], 'Fasting')
+        
+        filtered = self.converter.read_csv(
+            self.csv_file,
+            start_date=datetime(2025, 1, 1, 10, 0),
+            end_date=datetime(2025, 1, 1, 20, 0)
+        )
+        self.assertEqual([row['glucose'] for row in filtered], [8.0, 15.0])
+    
+    def test_default_output(self):
+        """Test XLSX creation without a template"""
+        self.write_csv(self.sample_rows())
+        output_file = os.path.join(self.temp_dir, 'output.xlsx')
+        
+        self.converter.create_xlsx(self.converter.read_csv(self.csv_file), output_file)
+        
+        self.assert_glucose_output(output_file, stats_row=7)
+    
+    def test_header_only_template(self):
+        """Test a template styling only the header gets the readings appended"""
+        template_wb = openpyxl.Workbook()
+        template_wb.active['A1'].font = Font(bold=True, size=14)
+        template_file = os.path.join(self.temp_dir, 'template.xlsx')
+        template_wb.save(template_file)
+        self.converter.template_path = Path(template_file)
+        
+        self.write_csv(self.sample_rows())
+        output_file = os.path.join(self.temp_dir, 'output.xlsx')
+        self.converter.create_xlsx(self.converter.read_csv(self.csv_file), output_file)
+        
+        self.assert_glucose_output(output_file, stats_row=7)
+        ws = openpyxl.load_workbook(output_file).active
+        self.assertEqual(ws['A1'].font.size, 14)
+    
+    def test_read_csv_dates(self):
+        """Test timestamps are parsed whole, not by their valid prefix"""
+        self.write_csv([
+            ['1', '14.5.25. 6:31', '5.5', '', 'Meter', '', '', '', '', ''],
+            ['2', '14.5.25. 7:15:42', '6.0', '', 'Meter', '', '', '', '', ''],
+            ['3', '6.1.2024 6:315', '7.0', '', 'Meter', '', '', '', '', ''],
+        ])
+        
+        data = self.converter.read_csv(self.csv_file)
+        
+        self.assertEqual([row['datetime'] for row in data],
+                         [datetime(2025, 5, 14, 6, 31), datetime(2025, 5, 14, 7, 15)])
+    
+    def test_styled_template_rows(self):
+        """Test pre-styled template rows keep their formatting"""
+        template_wb = openpyxl.Workbook()
+        template_ws = template_wb.active
+        thick = Side(style='thick')
+        for row in range(2, 9):
+            for col in range(1, 9):
+                cell = template_ws.cell(row=row, column=col, value='old')
+                cell.font = Font(italic=True)
+                cell.border = Border(left=thick, right=thick, top=thick, bottom=thick)
+        template_file = os.path.join(self.temp_dir, 'template.xlsx')
+        template_wb.save(template_file)
+        self.converter.template_path = Path(template_file)
+        
+        self.write_csv([
+            ['1', '1.1.25. 8:00', '3.5', 'Fasting', 'Meter', '', '', '', '', ''],
+            ['2', '1.1.25. 12:00', '8.0', 'Before Meal', 'Meter', '', '', '', '', ''],
+            ['3', '1.1.25. 18:00', '15.0', 'After Meal', 'Meter', '', '', '', '', ''],
+        ])
+        output_file = os.path.join(self.temp_dir, 'output.xlsx')
+        data = self.converter.read_csv(self.csv_file)
+        self.converter.create_xlsx(data, output_file)
+        
+        ws = openpyxl.load_workbook(output_file).active
+        
+        # Data written into the styled rows, formatting kept
+        self.assertEqual(ws['A1'].value, 'Date and Time')
+        self.assertEqual([ws.cell(row=row, column=2).value for row in range(2, 5)], [3.5, 8.0, 15.0])
+        self.assertTrue(ws['A3'].font.italic)
+        self.assertEqual(ws['C4'].border.left.style, 'thick')
+        self.assertEqual(ws['B2'].fill.start_color.rgb[-6:], self.converter.COLORS['low'])
+        self.assertEqual(ws['B4'].fill.start_color.rgb[-6:], self.converter.COLORS['high'])
+        
+        # Old template values cleared, statistics below the data
+        self.assertIsNone(ws['A5'].value)
+        self.assertEqual(ws['A6'].value, 'STATISTICS')
+        self.assertNotIn('old', [cell.value for row in ws.iter_rows() for cell in row])
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for complete workflow"""
     
     def setUp(self):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
     
     def tearDown(self):
         """Clean up"""
-        shutil.rmtree(self.temp_dir)
+        self._temp_dir.cleanup()
     
     def test_complete_workflow(self):
         """Test complete conversion workflow"""
@@ -498,24 +914,22 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(os.path.exists(output_file))
         
         # Load and check XLSX
-        wb = openpyxl.load_workbook(output_file)
-        ws = wb.active
+        wb = openpyxl.load_workbook(output_file, read_only=True, data_only=True, keep_links=False)
+        glucose_cells = [row[0] for row in wb.active.iter_rows(min_row=2, max_row=5,
+                                                               min_col=2, max_col=2)]
         
         # Check all data present
-        self.assertEqual(ws['B2'].value, 3.5)  # First glucose value
-        self.assertEqual(ws['B3'].value, 8.0)  # Second glucose value
-        self.assertEqual(ws['B4'].value, 15.0)  # Third glucose value
-        self.assertEqual(ws['B5'].value, 22.0)  # Fourth glucose value
+        self.assertEqual([cell.value for cell in glucose_cells], [3.5, 8.0, 15.0, 22.0])
         
-        # Check colors applied
-        low_cell = ws['B2']
-        high_cell = ws['B4']
-        very_high_cell = ws['B5']
+        # Check each range gets its color and normal readings stay unfilled
+        fill_colors = [
+            cell.fill.start_color.rgb[-6:] if cell.fill.fill_type else None
+            for cell in glucose_cells
+        ]
+        colors = converter.COLORS
+        self.assertEqual(fill_colors, [colors['low'], None, colors['high'], colors['very_high']])
         
-        # Check fills are applied (color-coded)
-        self.assertIsNotNone(low_cell.fill.start_color)
-        self.assertIsNotNone(high_cell.fill.start_color)
-        self.assertIsNotNone(very_high_cell.fill.start_color)
+        wb.close()
 
 
 def run_tests():
@@ -529,6 +943,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestTemplateManager))
     suite.addTests(loader.loadTestsFromTestCase(TestGlucoseConverter))
     suite.addTests(loader.loadTestsFromTestCase(TestUtilityFunctions))
+    suite.addTests(loader.loadTestsFromTestCase(TestBasicConverter))
+    suite.addTests(loader.loadTestsFromTestCase(TestSimplifiedConverter))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
     
     # Run tests